@@ -1,5 +1,5 @@
 import os
-from pathlib import Path
+import threading
 
 from flask import Flask, request, jsonify
 from flask_cors import CORS
@@ -16,6 +16,45 @@ except ImportError as e:
 app = Flask(__name__)
 CORS(app)
 
+# A valid configuration stays valid, so once validation passes it is not
+# repeated; while it fails, each request checks again so fixing the
+# environment (e.g. creating the vault folder) recovers without a restart
+_config_valid = False
+
+
+def _config_error():
+    """Return the current configuration error, or None once the configuration is valid."""
+    global _config_valid
+    if _config_valid:
+        return None
+    try:
+        config.validate()
+    except ValueError as e:
+        return e
+    _config_valid = True
+    return None
+
+
+# Validate at startup so a valid configuration is never checked again
+_config_error()
+
+# Markdown instances are not thread-safe, so each worker thread keeps its own
+_md_local = threading.local()
+
+
+def _get_markdown() -> markdown.Markdown:
+    """Return this thread's reusable Markdown converter."""
+    md = getattr(_md_local, 'md', None)
+    if md is None:
+        md = _md_local.md = markdown.Markdown()
+    return md
+
+
+def _render_markdown(content: str) -> str:
+    """Render markdown to HTML with this thread's converter."""
+    return _get_markdown().reset().convert(content)
+
+
 @app.route('/')
 def index():
     return "Welcome to the Obsidian Agent API!"
@@ -37,15 +76,17 @@ def message():
             days = int(date_range)
         except Exception:
             days = 7
+    config_error = _config_error()
+    if config_error is not None:
+        return jsonify({'error': str(config_error)}), 500
     try:
-        config.validate()
         ensure_vault_structure()
         processed = process_observation_notes(days)
         markdown_content = generate_weekly_review_markdown(processed)
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
-    html_preview = markdown.markdown(markdown_content)
+    html_preview = _render_markdown(markdown_content)
     return jsonify({
         'response': markdown_content,
         'preview': html_preview,
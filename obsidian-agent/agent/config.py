@@ -1,15 +1,49 @@
 
 """Configuration management for the Obsidian agent."""
 
+import functools
 import os
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional
 
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
 load_dotenv()
 
+# Folder inside the vault holding the agent's caches; Obsidian ignores dot
+# folders, and one folder is easy to exclude from sync, git and backups
+AGENT_DIR_NAME = '.obsidian-agent'
+
+# Top-level folders whose presence marks a vault as using the PARA layout
+PARA_MARKER_FOLDERS = ('00_Inbox', '01_Templates', '02_Projects', '03_Areas', '04_Resources')
+
+# Destination folder for each PARA type in PARA vaults
+PARA_FOLDERS = {
+    'inbox': '00_Inbox',
+    'template': '01_Templates',
+    'project': '02_Projects',
+    'area': '03_Areas',
+    'resource': '04_Resources',
+    'daily': '05_Daily',
+    'archive': '06_Archive'
+}
+
+# Destination folder for each note type in non-PARA vaults
+TYPE_FOLDERS = {
+    'observation': '3-Areas/Mind-Body-System/observations',
+    'hypothesis': '3-Areas/Mind-Body-System/hypotheses',
+    'review': '3-Areas/Mind-Body-System/reviews',
+    'project': '2-Projects',
+    'note': '1-Inbox'
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _has_para_layout(vault_path: str) -> bool:
+    """Check for PARA marker folders, once per vault path string."""
+    return any(os.path.exists(os.path.join(vault_path, folder)) for folder in PARA_MARKER_FOLDERS)
+
 
 class Config:
     """Configuration class for the Obsidian agent."""
@@ -33,6 +67,25 @@ class Config:
                 f"Vault path does not exist: {self.vault_path}. "
                 "Please check your VAULT_PATH configuration."
             )
+    
+    @property
+    def is_para_vault(self) -> bool:
+        """Check if vault is using PARA structure (computed once per vault, see invalidate_layout_cache)."""
+        return _has_para_layout(str(self.vault_path))
+    
+    @functools.cached_property
+    def para_targets(self) -> Dict[str, Path]:
+        """Absolute destination folder for each PARA type, built once per vault."""
+        return {para_type: self.vault_path / folder for para_type, folder in PARA_FOLDERS.items()}
+    
+    @functools.cached_property
+    def type_targets(self) -> Dict[str, Path]:
+        """Absolute destination folder for each note type, built once per vault."""
+        return {note_type: self.vault_path / folder for note_type, folder in TYPE_FOLDERS.items()}
+    
+    def invalidate_layout_cache(self) -> None:
+        """Forget the cached vault layout after folders have been created or removed."""
+        _has_para_layout.cache_clear()
 
 
 # Global config instance
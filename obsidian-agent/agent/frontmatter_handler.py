@@ -2,13 +2,47 @@
 """Module for handling frontmatter operations in Obsidian notes."""
 
 import re
-from datetime import datetime
 from pathlib import Path
-from typing import Dict
+from typing import Optional
 
 import frontmatter
 
 from .config import config
+from .naming_utils import current_date
+
+# Hashtags in note content, e.g. #productivity or #my-tag
+_TAG_RE = re.compile(r'#([\w-]+)')
+
+# Filenames starting with an ISO date, e.g. 2024-01-15
+_DATE_ONLY_RE = re.compile(r'^\d{4}-\d{2}-\d{2}')
+
+# Folder names that imply a note type, in priority order
+_TYPE_FOLDER_HINTS = (
+    ('observations', 'observation'),
+    ('hypotheses', 'hypothesis'),
+    ('reviews', 'review'),
+    ('projects', 'project')
+)
+_TYPE_FOLDER_NAMES = frozenset(folder for folder, _ in _TYPE_FOLDER_HINTS)
+
+# Type-indicating phrases almost always appear near the top of a note, so
+# content inference only looks at this many leading characters
+CONTENT_HEAD_CHARS = 4096
+
+_OBSERVATION_PHRASES = ('i observed', 'noticed that', 'observation:')
+_HYPOTHESIS_PHRASES = ('hypothesis:', 'i think', 'theory:')
+_REVIEW_PHRASES = ('weekly review', 'summary', 'reflection')
+
+# 'proj' also matches 'project'
+_PROJECT_KEYWORDS = ('proj',)
+_DAILY_KEYWORDS = ('daily', 'journal')
+_RESOURCE_KEYWORDS = ('guide', 'reference', 'resource')
+_AREA_KEYWORDS = ('area', 'responsibility')
+
+_PROJECT_PHRASES = ('project:', 'deadline:', 'deliverable:')
+_DAILY_PHRASES = ('daily note', 'today i')
+_RESOURCE_PHRASES = ('reference', 'guide:', 'tutorial:')
+_AREA_PHRASES = ('ongoing', 'responsibility')
 
 
 def ensure_frontmatter(post: frontmatter.Post, note_path: Path) -> bool:
@@ -28,9 +62,14 @@ def ensure_frontmatter(post: frontmatter.Post, note_path: Path) -> bool:
     if not post.metadata:
         modified = True
     
+    # Lowercased head of the note, shared by both inference helpers
+    content_head = None
+    if 'type' not in post.metadata or ('para_type' not in post.metadata and config.is_para_vault):
+        content_head = post.content[:CONTENT_HEAD_CHARS].lower()
+    
     # Ensure required fields exist
     if 'type' not in post.metadata:
-        post.metadata['type'] = infer_type_from_content(post.content, note_path)
+        post.metadata['type'] = infer_type_from_content(post.content, note_path, content_head)
         modified = True
     
     if 'status' not in post.metadata:
@@ -42,13 +81,13 @@ def ensure_frontmatter(post: frontmatter.Post, note_path: Path) -> bool:
         modified = True
     
     # Add PARA-specific fields if using PARA structure
-    if _is_para_vault():
+    if config.is_para_vault:
         if 'para_type' not in post.metadata:
-            post.metadata['para_type'] = infer_para_type_basic(post.content, note_path)
+            post.metadata['para_type'] = infer_para_type_basic(post.content, note_path, content_head)
             modified = True
         
         if 'last_modified' not in post.metadata:
-            post.metadata['last_modified'] = datetime.now().strftime('%Y-%m-%d')
+            post.metadata['last_modified'] = current_date()
             modified = True
     
     return modified
@@ -66,8 +105,12 @@ def normalize_tags(post: frontmatter.Post) -> bool:
     """
     modified = False
     
+    # Notes without any hashtag have nothing to merge
+    if '#' not in post.content:
+        return modified
+    
     # Extract tags from content (hashtags)
-    content_tags = re.findall(r'#([\w-]+)', post.content)
+    content_tags = set(_TAG_RE.findall(post.content))
     
     # Get existing frontmatter tags
     fm_tags = post.metadata.get('tags', [])
@@ -75,45 +118,40 @@ def normalize_tags(post: frontmatter.Post) -> bool:
         fm_tags = [fm_tags]
     elif not isinstance(fm_tags, list):
         fm_tags = []
+    fm_tags_set = set(fm_tags)
     
-    # Combine and deduplicate
-    all_tags = list(set(fm_tags + content_tags))
-    
-    # Update if different
-    if set(all_tags) != set(fm_tags):
-        post.metadata['tags'] = sorted(all_tags)
+    # Update if content has tags missing from frontmatter
+    if not content_tags <= fm_tags_set:
+        post.metadata['tags'] = sorted(fm_tags_set | content_tags)
         modified = True
     
     return modified
 
 
-def infer_type_from_content(content: str, note_path: Path) -> str:
+def infer_type_from_content(content: str, note_path: Path, content_head: Optional[str] = None) -> str:
     """
     Infer the note type based on content, filename, and folder location.
     
     Args:
         content: The note content
         note_path: Path to the note file
+        content_head: Optional precomputed lowercase head of the content
         
     Returns:
         Inferred type string
     """
-    # Check folder structure for hints
-    path_parts = note_path.parts
-    if 'observations' in path_parts:
-        return 'observation'
-    elif 'hypotheses' in path_parts:
-        return 'hypothesis'
-    elif 'reviews' in path_parts:
-        return 'review'
-    elif 'projects' in path_parts:
-        return 'project'
-    
-    # Check filename patterns
+    # Check folder structure for hints; one set intersection rejects most paths
+    path_folders = _TYPE_FOLDER_NAMES.intersection(note_path.parts)
+    if path_folders:
+        for folder, note_type in _TYPE_FOLDER_HINTS:
+            if folder in path_folders:
+                return note_type
+    
+    # Check filename patterns ('obs' and 'hyp' also match the full words)
     filename = note_path.stem.lower()
-    if 'observation' in filename or 'obs' in filename:
+    if 'obs' in filename:
         return 'observation'
-    elif 'hypothesis' in filename or 'hyp' in filename:
+    elif 'hyp' in filename:
         return 'hypothesis'
     elif 'review' in filename:
         return 'review'
@@ -121,65 +159,57 @@ def infer_type_from_content(content: str, note_path: Path) -> str:
         return 'project'
     
     # Check content patterns
-    content_lower = content.lower()
-    if any(phrase in content_lower for phrase in ['i observed', 'noticed that', 'observation:']):
+    if content_head is None:
+        content_head = content[:CONTENT_HEAD_CHARS].lower()
+    if any(phrase in content_head for phrase in _OBSERVATION_PHRASES):
         return 'observation'
-    elif any(phrase in content_lower for phrase in ['hypothesis:', 'i think', 'theory:']):
+    elif any(phrase in content_head for phrase in _HYPOTHESIS_PHRASES):
         return 'hypothesis'
-    elif any(phrase in content_lower for phrase in ['weekly review', 'summary', 'reflection']):
+    elif any(phrase in content_head for phrase in _REVIEW_PHRASES):
         return 'review'
     
     # Default fallback
     return 'note'
 
 
-def infer_para_type_basic(content: str, note_path: Path) -> str:
+def infer_para_type_basic(content: str, note_path: Path, content_head: Optional[str] = None) -> str:
     """
     Basic PARA type inference for tidier module.
     
     Args:
         content: The note content
         note_path: Path to the note file
+        content_head: Optional precomputed lowercase head of the content
         
     Returns:
         Inferred PARA type string
     """
     filename = note_path.stem.lower()
-    content_lower = content.lower()
     
     # Check for daily notes
-    if re.match(r'^\d{4}-\d{2}-\d{2}', filename):
+    if _DATE_ONLY_RE.match(filename):
         return 'daily'
     
     # Check for common patterns
-    if any(keyword in filename for keyword in ['project', 'proj']):
+    if any(keyword in filename for keyword in _PROJECT_KEYWORDS):
         return 'project'
-    elif any(keyword in filename for keyword in ['daily', 'journal']):
+    elif any(keyword in filename for keyword in _DAILY_KEYWORDS):
         return 'daily'
-    elif any(keyword in filename for keyword in ['guide', 'reference', 'resource']):
+    elif any(keyword in filename for keyword in _RESOURCE_KEYWORDS):
         return 'resource'
-    elif any(keyword in filename for keyword in ['area', 'responsibility']):
+    elif any(keyword in filename for keyword in _AREA_KEYWORDS):
         return 'area'
     
     # Check content
-    if any(phrase in content_lower for phrase in ['project:', 'deadline:', 'deliverable:']):
+    if content_head is None:
+        content_head = content[:CONTENT_HEAD_CHARS].lower()
+    if any(phrase in content_head for phrase in _PROJECT_PHRASES):
         return 'project'
-    elif any(phrase in content_lower for phrase in ['daily note', 'today i']):
+    elif any(phrase in content_head for phrase in _DAILY_PHRASES):
         return 'daily'
-    elif any(phrase in content_lower for phrase in ['reference', 'guide:', 'tutorial:']):
+    elif any(phrase in content_head for phrase in _RESOURCE_PHRASES):
         return 'resource'
-    elif any(phrase in content_lower for phrase in ['ongoing', 'responsibility']):
+    elif any(phrase in content_head for phrase in _AREA_PHRASES):
         return 'area'
     
     return 'inbox'
-
-
-def _is_para_vault() -> bool:
-    """Check if vault is using PARA structure."""
-    para_folders = ['00_Inbox', '01_Templates', '02_Projects', '03_Areas', '04_Resources']
-    
-    for folder in para_folders:
-        if (config.vault_path / folder).exists():
-            return True
-    
-    return False
@@ -1,17 +1,84 @@
 
 """OpenAI GPT client for summarizing observation notes."""
 
-from typing import Dict, Any
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Union
 import openai
-from .config import config
+from .config import AGENT_DIR_NAME, config
+from .writer import write_text
+
+MODEL = "gpt-4o"
+
+# Upper bound on in-flight GPT requests when summarizing several notes
+MAX_CONCURRENT_REQUESTS = 8
+
+# Per-request timeout in seconds and retry count for the shared OpenAI client
+REQUEST_TIMEOUT = 30
+MAX_RETRIES = 2
+
+# Reply budget of one note's summary; a request allowed a longer reply gets
+# REQUEST_TIMEOUT per this many tokens, so batches are not cut off and retried
+SUMMARY_MAX_TOKENS = 500
+
+# Number of notes combined into a single GPT request by summarize_many
+BATCH_SIZE = 4
+
+# Summaries are cached on disk in this folder of the vault's agent folder,
+# one JSON file per note content hash, so unchanged notes are not re-sent
+# on later runs
+CACHE_DIR_NAME = "gpt-cache"
+
+# Least recently used cache entries beyond this count are removed
+CACHE_MAX_ENTRIES = 2000
+
+# Summaries also kept in memory, so repeats within one run skip the disk
+MEMORY_CACHE_ENTRIES = 1024
+
+SYSTEM_PROMPT = "You are an expert at analyzing personal observation notes and identifying patterns, insights, and areas for further exploration."
+
+# Response section prefixes and the result keys they populate; batched
+# responses number them per note, e.g. "SUMMARY_2:"
+_SECTION_KEYS = {
+    "SUMMARY": "summary",
+    "HYPOTHESIS": "hypothesis",
+    "FOLLOW_UP": "follow_up_question"
+}
 
 
 class GPTClient:
     """Client for interacting with OpenAI's GPT models."""
     
     def __init__(self):
-        """Initialize the GPT client with API key."""
-        openai.api_key = config.openai_api_key
+        """Initialize the GPT client; the OpenAI client is created on first use."""
+        self._client = None
+        self._client_lock = threading.Lock()
+        self._memory_cache: "OrderedDict[str, Dict[str, str]]" = OrderedDict()
+        self._memory_lock = threading.Lock()
+    
+    @property
+    def client(self) -> "openai.OpenAI":
+        """
+        Return the shared OpenAI client, creating it on first use.
+        
+        A single client keeps its HTTP connection pool alive across requests,
+        so consecutive summaries reuse connections instead of paying a new
+        TLS handshake each time.
+        """
+        if self._client is None:
+            with self._client_lock:
+                if self._client is None:
+                    self._client = openai.OpenAI(
+                        api_key=config.openai_api_key,
+                        timeout=REQUEST_TIMEOUT,
+                        max_retries=MAX_RETRIES
+                    )
+        return self._client
     
     def summarize(self, text: str) -> Dict[str, str]:
         """
@@ -23,6 +90,10 @@ class GPTClient:
         Returns:
             Dictionary with keys: summary, hypothesis, follow_up_question
         """
+        cached = self._cache_get(text)
+        if cached is not None:
+            return cached
+        
         prompt = f"""
         Please analyze the following observation note and provide:
         1. A concise summary of the key observations
@@ -38,26 +109,231 @@ class GPTClient:
         FOLLOW_UP: [your follow-up question here]
         """
         
+        content = self._complete(prompt, max_tokens=SUMMARY_MAX_TOKENS)
+        result = self._parse_response(content)
+        self._cache_put(text, result)
+        return result
+    
+    def summarize_batch(self, texts: List[str]) -> List[Dict[str, str]]:
+        """
+        Summarize several observation texts with a single GPT request.
+        
+        Args:
+            texts: The observation note contents to summarize
+            
+        Returns:
+            One dictionary per input text, in order, with keys: summary,
+            hypothesis, follow_up_question. Sections the model did not return
+            are left empty.
+        """
+        notes = "\n\n".join(f"Note {i}:\n{text}" for i, text in enumerate(texts, 1))
+        
+        prompt = f"""
+        Please analyze each of the following {len(texts)} observation notes and, for each note, provide:
+        1. A concise summary of the key observations
+        2. A hypothesis about patterns or insights
+        3. A follow-up question for deeper investigation
+
+        {notes}
+
+        Please format your response as follows, where N is the note number:
+        SUMMARY_N: [your summary here]
+        HYPOTHESIS_N: [your hypothesis here]
+        FOLLOW_UP_N: [your follow-up question here]
+        """
+        
+        content = self._complete(prompt, max_tokens=SUMMARY_MAX_TOKENS * len(texts))
+        return self._parse_batch_response(content, len(texts))
+    
+    def summarize_many(self, texts: Iterable[str]) -> List[Union[Dict[str, str], Exception]]:
+        """
+        Summarize several observation texts concurrently.
+        
+        Notes are grouped into batches of ``BATCH_SIZE`` so each GPT request
+        covers several notes, and the batches are fanned out over a bounded
+        thread pool instead of being issued one after another. Notes with a
+        cached summary are answered from the cache without a request.
+        
+        Args:
+            texts: The observation note contents to summarize
+            
+        Returns:
+            One entry per input text, in order. Failed summaries are returned
+            as the raised exception rather than a dictionary.
+        """
+        results = []
+        batches = []
+        
+        with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS) as executor:
+            batch = []
+            indexes = []
+            for text in texts:
+                cached = self._cache_get(text)
+                results.append(cached)
+                if cached is not None:
+                    continue
+                
+                batch.append(text)
+                indexes.append(len(results) - 1)
+                if len(batch) == BATCH_SIZE:
+                    batches.append((indexes, executor.submit(self._summarize_chunk, batch)))
+                    batch = []
+                    indexes = []
+            if batch:
+                batches.append((indexes, executor.submit(self._summarize_chunk, batch)))
+        
+        for indexes, future in batches:
+            try:
+                chunk_results = future.result()
+            except Exception as e:
+                chunk_results = [e] * len(indexes)
+            for index, result in zip(indexes, chunk_results):
+                results[index] = result
+        
+        if batches:
+            self._prune_cache()
+        
+        return results
+    
+    def _summarize_chunk(self, texts: List[str]) -> List[Union[Dict[str, str], Exception]]:
+        """
+        Summarize one batch, retrying individually any note the batch reply missed.
+        
+        If the batch request itself fails, every note is retried on its own,
+        so one bad note or a failed request does not fail the whole batch.
+        """
+        if len(texts) == 1:
+            return [self.summarize(texts[0])]
+        
+        try:
+            results = self.summarize_batch(texts)
+        except Exception:
+            results = [{"summary": ""} for _ in texts]
+        
+        for i, result in enumerate(results):
+            if result["summary"]:
+                self._cache_put(texts[i], result)
+                continue
+            try:
+                results[i] = self.summarize(texts[i])
+            except Exception as e:
+                results[i] = e
+        
+        return results
+    
+    def _cache_key(self, text: str) -> str:
+        """
+        Return the cache key for a note's content.
+        
+        The key combines a BLAKE2b hash of the content with the model name, so
+        switching models never serves summaries produced by another model.
+        """
+        digest = hashlib.blake2b(text.encode('utf-8'), digest_size=16).hexdigest()
+        return f"{digest}-{MODEL}"
+    
+    def _cache_path(self, key: str) -> Optional[Path]:
+        """Return the cache file for a cache key, or None if caching is unavailable."""
+        if not config.vault_path.is_dir():
+            return None
+        return config.vault_path / AGENT_DIR_NAME / CACHE_DIR_NAME / f"{key}.json"
+    
+    def _cache_get(self, text: str) -> Optional[Dict[str, str]]:
+        """Return the cached summary for this content, if there is one."""
+        key = self._cache_key(text)
+        
+        with self._memory_lock:
+            result = self._memory_cache.get(key)
+            if result is not None:
+                self._memory_cache.move_to_end(key)
+                return dict(result)
+        
+        cache_path = self._cache_path(key)
+        if cache_path is None:
+            return None
+        
+        try:
+            with open(cache_path, 'r', encoding='utf-8') as f:
+                result = json.load(f)
+            # Bump the modification time so pruning evicts least recently used entries
+            os.utime(cache_path)
+        except (OSError, ValueError):
+            return None
+        
+        self._remember(key, result)
+        return result
+    
+    def _cache_put(self, text: str, result: Dict[str, str]) -> None:
+        """Store a summary in the cache; failures only cost a future cache miss."""
+        key = self._cache_key(text)
+        self._remember(key, result)
+        
+        cache_path = self._cache_path(key)
+        if cache_path is None:
+            return
+        
+        # write_text renames a per-thread temp file into place, so batches
+        # caching the same note concurrently never leave a torn entry
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            write_text(cache_path, json.dumps(result))
+        except OSError:
+            pass
+    
+    def _remember(self, key: str, result: Dict[str, str]) -> None:
+        """Keep a summary in the in-memory cache, evicting the least recently used."""
+        with self._memory_lock:
+            self._memory_cache[key] = dict(result)
+            self._memory_cache.move_to_end(key)
+            if len(self._memory_cache) > MEMORY_CACHE_ENTRIES:
+                self._memory_cache.popitem(last=False)
+    
+    def _prune_cache(self) -> None:
+        """Remove the least recently used cache entries beyond ``CACHE_MAX_ENTRIES``."""
+        cache_dir = config.vault_path / AGENT_DIR_NAME / CACHE_DIR_NAME
+        
+        try:
+            with os.scandir(cache_dir) as it:
+                entries = [(entry.stat().st_mtime, entry.path) for entry in it if entry.name.endswith('.json')]
+        except OSError:
+            return
+        
+        if len(entries) <= CACHE_MAX_ENTRIES:
+            return
+        
+        entries.sort()
+        for _, path in entries[:len(entries) - CACHE_MAX_ENTRIES]:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+    
+    def _complete(self, prompt: str, max_tokens: int) -> str:
+        """
+        Send a prompt to the chat completions API and return the reply text.
+        
+        Raises:
+            RuntimeError: If the API request fails
+        """
         try:
-            response = openai.chat.completions.create(
-                model="gpt-4o",
+            response = self.client.chat.completions.create(
+                model=MODEL,
                 messages=[
                     {
                         "role": "system",
-                        "content": "You are an expert at analyzing personal observation notes and identifying patterns, insights, and areas for further exploration."
+                        "content": SYSTEM_PROMPT
                     },
                     {
                         "role": "user",
                         "content": prompt
                     }
                 ],
-                max_tokens=500,
-                temperature=0.7
+                max_tokens=max_tokens,
+                temperature=0.7,
+                timeout=REQUEST_TIMEOUT * max(1, max_tokens / SUMMARY_MAX_TOKENS)
             )
             
-            content = response.choices[0].message.content
-            return self._parse_response(content)
-            
+            return response.choices[0].message.content
+        
         except Exception as e:
             raise RuntimeError(f"Failed to get GPT response: {str(e)}")
     
@@ -71,31 +347,52 @@ class GPTClient:
         Returns:
             Dictionary with parsed summary, hypothesis, and follow_up_question
         """
-        result = {
-            "summary": "",
-            "hypothesis": "",
-            "follow_up_question": ""
-        }
+        sections = {key: [] for key in _SECTION_KEYS.values()}
+        current_section = None
         
-        lines = content.split('\n')
+        for line in content.splitlines():
+            line = line.strip()
+            head, sep, rest = line.partition(":")
+            if sep and head in _SECTION_KEYS:
+                current_section = sections[_SECTION_KEYS[head]] = [rest.strip()]
+            elif current_section is not None and line:
+                # Continue adding to the current section if we have content
+                current_section.append(line)
+        
+        return {key: " ".join(parts) for key, parts in sections.items()}
+    
+    def _parse_batch_response(self, content: str, count: int) -> List[Dict[str, str]]:
+        """
+        Parse a batched GPT response with numbered sections into dictionaries.
+        
+        Args:
+            content: The raw GPT response content
+            count: Number of notes that were sent in the batch
+            
+        Returns:
+            One parsed dictionary per note, in note order
+        """
+        notes = [{key: [] for key in _SECTION_KEYS.values()} for _ in range(count)]
         current_section = None
         
-        for line in lines:
+        for line in content.splitlines():
             line = line.strip()
-            if line.startswith("SUMMARY:"):
-                current_section = "summary"
-                result["summary"] = line.replace("SUMMARY:", "").strip()
-            elif line.startswith("HYPOTHESIS:"):
-                current_section = "hypothesis"
-                result["hypothesis"] = line.replace("HYPOTHESIS:", "").strip()
-            elif line.startswith("FOLLOW_UP:"):
-                current_section = "follow_up_question"
-                result["follow_up_question"] = line.replace("FOLLOW_UP:", "").strip()
-            elif current_section and line:
+            head, sep, rest = line.partition(":")
+            name, _, number = head.rpartition("_")
+            if sep and name in _SECTION_KEYS and number.isdigit():
+                index = int(number) - 1
+                if 0 <= index < count:
+                    current_section = notes[index][_SECTION_KEYS[name]] = [rest.strip()]
+                else:
+                    current_section = None
+            elif current_section is not None and line:
                 # Continue adding to the current section if we have content
-                result[current_section] += " " + line
+                current_section.append(line)
         
-        return result
+        return [
+            {key: " ".join(parts) for key, parts in sections.items()}
+            for sections in notes
+        ]
 
 
 # Global GPT client instance
@@ -2,22 +2,33 @@
 """Module for managing wikilinks and updating references when files are moved."""
 
 import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Set, Tuple
+from typing import Dict, List, Optional, Tuple
 
 from .config import config
+from .vault_reader import iter_markdown_files, read_text
+from .writer import write_text
 
+# Obsidian wikilinks, capturing the inner target and optional display text
+_WIKILINK_RE = re.compile(r'\[\[([^\]]+)\]\]')
 
-def scan_and_update_links(file_moves: Dict[Path, Path], dry_run: bool = False) -> Dict[str, int]:
+# Number of threads used to read and scan notes concurrently
+SCAN_WORKERS = 16
+
+
+def scan_vault(
+    file_moves: Optional[Dict[Path, Path]] = None, dry_run: bool = False
+) -> Tuple[Dict[str, int], List[Tuple[Path, str]]]:
     """
-    Scan vault for wikilinks and update them when files are moved.
+    Scan every note in the vault once, updating moved-file links and collecting broken links.
     
     Args:
-        file_moves: Dictionary mapping old paths to new paths
+        file_moves: Optional dictionary mapping old paths to new paths
         dry_run: If True, only report what would be updated
         
     Returns:
-        Dictionary with counts of updates performed
+        (stats_dict, [(file_path, broken_link), ...])
     """
     stats = {
         'files_scanned': 0,
@@ -25,62 +36,64 @@ def scan_and_update_links(file_moves: Dict[Path, Path], dry_run: bool = False) -
         'links_updated': 0,
         'broken_links': 0
     }
+    broken_links = []
     
     # Create a mapping of old names to new names
     name_mapping = {}
-    for old_path, new_path in file_moves.items():
+    for old_path, new_path in (file_moves or {}).items():
         old_name = old_path.stem
         new_name = new_path.stem
         if old_name != new_name:
             name_mapping[old_name] = new_name
     
-    # Scan all markdown files
-    for md_file in config.vault_path.rglob("*.md"):
-        if md_file.is_file():
-            stats['files_scanned'] += 1
-            
-            try:
-                with open(md_file, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                
-                # Find all wikilinks
-                wikilink_pattern = r'\[\[([^\]]+)\]\]'
-                matches = re.findall(wikilink_pattern, content)
-                stats['links_found'] += len(matches)
-                
-                # Update content if needed
-                updated_content = content
-                updated = False
-                
-                for match in matches:
-                    link_name = match.split('|')[0].strip()  # Handle display text
-                    
-                    if link_name in name_mapping:
-                        old_link = f"[[{match}]]"
-                        new_link_name = name_mapping[link_name]
-                        
-                        # Preserve display text if it exists
-                        if '|' in match:
-                            display_text = match.split('|')[1].strip()
-                            new_link = f"[[{new_link_name}|{display_text}]]"
-                        else:
-                            new_link = f"[[{new_link_name}]]"
-                        
-                        updated_content = updated_content.replace(old_link, new_link)
-                        updated = True
-                        stats['links_updated'] += 1
-                        
-                        if dry_run:
-                            print(f"  🔗 Would update link in {md_file.name}: {old_link} → {new_link}")
-                
-                # Save updated content
-                if updated and not dry_run:
-                    with open(md_file, 'w', encoding='utf-8') as f:
-                        f.write(updated_content)
-                
-            except Exception as e:
-                print(f"❌ Error updating links in {md_file}: {e}")
+    # Walk the vault once; the same list feeds both the name index and the scan
+    md_files = [Path(entry.path) for entry in iter_markdown_files(config.vault_path)]
+    all_files = frozenset(f.stem for f in md_files)
+    
+    # Read and scan files concurrently; results are collected in vault order
+    with ThreadPoolExecutor(max_workers=SCAN_WORKERS) as executor:
+        futures = [
+            executor.submit(_scan_file, md_file, name_mapping, dry_run)
+            for md_file in md_files
+        ]
+    
+    for md_file, future in zip(md_files, futures):
+        stats['files_scanned'] += 1
+        
+        try:
+            link_names, rewrites = future.result()
+        except Exception as e:
+            print(f"❌ Error scanning {md_file}: {e}")
+            continue
+        
+        stats['links_found'] += len(link_names)
+        stats['links_updated'] += len(rewrites)
+        
+        for link_name in link_names:
+            if link_name not in all_files:
+                broken_links.append((md_file, link_name))
+        
+        if dry_run:
+            for old_link, new_link in rewrites:
+                print(f"  🔗 Would update link in {md_file.name}: {old_link} → {new_link}")
+    
+    stats['broken_links'] = len(broken_links)
+    
+    return stats, broken_links
+
+
+def scan_and_update_links(file_moves: Dict[Path, Path], dry_run: bool = False) -> Dict[str, int]:
+    """
+    Scan vault for wikilinks and update them when files are moved.
     
+    Args:
+        file_moves: Dictionary mapping old paths to new paths
+        dry_run: If True, only report what would be updated
+        
+    Returns:
+        Dictionary with counts of updates performed
+    """
+    stats, _ = scan_vault(file_moves, dry_run)
     return stats
 
 
@@ -91,32 +104,74 @@ def find_broken_links() -> List[Tuple[Path, str]]:
     Returns:
         List of tuples containing (file_path, broken_link)
     """
-    broken_links = []
+    _, broken_links = scan_vault()
+    return broken_links
+
+
+def _scan_file(
+    md_file: Path, name_mapping: Dict[str, str], dry_run: bool
+) -> Tuple[List[str], List[Tuple[str, str]]]:
+    """
+    Read one note, rewrite its links to moved files and save it if anything changed.
     
-    # Get all markdown files
-    all_files = {f.stem for f in config.vault_path.rglob("*.md") if f.is_file()}
-    
-    # Scan for wikilinks
-    for md_file in config.vault_path.rglob("*.md"):
-        if md_file.is_file():
-            try:
-                with open(md_file, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                
-                # Find all wikilinks
-                wikilink_pattern = r'\[\[([^\]]+)\]\]'
-                matches = re.findall(wikilink_pattern, content)
-                
-                for match in matches:
-                    link_name = match.split('|')[0].strip()  # Handle display text
-                    
-                    if link_name not in all_files:
-                        broken_links.append((md_file, link_name))
-                        
-            except Exception as e:
-                print(f"❌ Error scanning {md_file} for broken links: {e}")
+    Returns:
+        ([link_name, ...], [(old_link, new_link), ...])
+    """
+    content = read_text(md_file)
     
-    return broken_links
+    # Rewrite all wikilinks in a single pass
+    updated_content, link_names, rewrites = _rewrite_links(content, name_mapping)
+    
+    # Save updated content
+    if rewrites and not dry_run:
+        write_text(md_file, updated_content)
+    
+    return link_names, rewrites
+
+
+def _rewrite_links(content: str, name_mapping: Dict[str, str]) -> Tuple[str, List[str], List[Tuple[str, str]]]:
+    """
+    Rewrite wikilinks that point at renamed notes in one pass over the content.
+    
+    Args:
+        content: The note content
+        name_mapping: Dictionary mapping old note names to new note names
+        
+    Returns:
+        (updated_content, [link_name, ...], [(old_link, new_link), ...]) where
+        the link names are the targets after any rewrite
+    """
+    # Nothing to rewrite (e.g. the broken-links report): collect the targets
+    # with findall instead of rebuilding the content through a callback
+    if not name_mapping:
+        link_names = [inner.partition('|')[0].strip() for inner in _WIKILINK_RE.findall(content)]
+        return content, link_names, []
+    
+    link_names = []
+    rewrites = []
+    
+    def replace(match):
+        inner = match.group(1)
+        link_name, sep, display_text = inner.partition('|')  # Handle display text
+        link_name = link_name.strip()
+        new_link_name = name_mapping.get(link_name)
+        
+        if not new_link_name:
+            link_names.append(link_name)
+            return match.group(0)
+        
+        # Preserve display text if it exists
+        if sep:
+            new_link = f"[[{new_link_name}|{display_text.strip()}]]"
+        else:
+            new_link = f"[[{new_link_name}]]"
+        
+        link_names.append(new_link_name)
+        rewrites.append((match.group(0), new_link))
+        return new_link
+    
+    updated_content = _WIKILINK_RE.sub(replace, content)
+    return updated_content, link_names, rewrites
 
 
 def generate_broken_links_report() -> str:
@@ -4,9 +4,41 @@
 import re
 from datetime import datetime
 from pathlib import Path
+from typing import Optional
 
 import frontmatter
 
+from .config import config
+
+# Filenames that already follow the YYYY-MM-DD--slug convention
+_DATE_PREFIX_RE = re.compile(r'^\d{4}-\d{2}-\d{2}--')
+
+_TITLE_INVALID_RE = re.compile(r'[^\w\s\-]')
+_SLUG_INVALID_RE = re.compile(r'[^\w\-]')
+_DASHES_RE = re.compile(r'-+')
+
+# Today's date for the current tidy/migrate run, see current_date
+_current_date: Optional[str] = None
+
+
+def current_date() -> str:
+    """
+    Return today's date as YYYY-MM-DD, formatted once per run.
+    
+    Returns:
+        The date string shared by every note processed in this run
+    """
+    global _current_date
+    if _current_date is None:
+        _current_date = datetime.now().strftime('%Y-%m-%d')
+    return _current_date
+
+
+def reset_current_date() -> None:
+    """Start a new run so the next current_date() call reads the clock again."""
+    global _current_date
+    _current_date = None
+
 
 def get_conventional_name(note_path: Path, post: frontmatter.Post) -> str:
     """
@@ -21,17 +53,20 @@ def get_conventional_name(note_path: Path, post: frontmatter.Post) -> str:
     """
     current_name = note_path.name
     
+    # A date-prefixed name is kept as-is for daily notes and in non-PARA
+    # vaults; check it before any metadata, layout or date work
+    if _DATE_PREFIX_RE.match(current_name):
+        if post.metadata.get('para_type') == 'daily' or not config.is_para_vault:
+            return current_name
+    
     # If using PARA structure, use PARA naming conventions
-    if _is_para_vault():
+    if config.is_para_vault:
         para_type = post.metadata.get('para_type', 'inbox')
         
         # For daily notes, ensure date prefix
         if para_type == 'daily':
-            if re.match(r'^\d{4}-\d{2}-\d{2}--', current_name):
-                return current_name
-            
             # Get date and create proper daily note name
-            date_str = post.metadata.get('date_created', datetime.now().strftime('%Y-%m-%d'))
+            date_str = post.metadata.get('date_created', current_date())
             try:
                 if isinstance(date_str, str):
                     date_obj = datetime.fromisoformat(date_str.replace('Z', '+00:00'))
@@ -45,17 +80,13 @@ def get_conventional_name(note_path: Path, post: frontmatter.Post) -> str:
         
         # For other PARA types, use title case
         title = post.metadata.get('title', note_path.stem)
-        normalized = re.sub(r'[^\w\s\-]', '', title)
+        normalized = _TITLE_INVALID_RE.sub('', title)
         normalized = ' '.join(word.capitalize() for word in normalized.split())
         normalized = normalized.replace(' ', '_')
         
         return f"{normalized}.md"
     
-    # Original naming logic for non-PARA vaults
-    if re.match(r'^\d{4}-\d{2}-\d{2}--', current_name):
-        return current_name
-    
-    # Get date from frontmatter or file mtime
+    # Original naming logic for non-PARA vaults: get date from frontmatter or file mtime
     date_str = post.metadata.get('date')
     if date_str:
         try:
@@ -70,20 +101,7 @@ def get_conventional_name(note_path: Path, post: frontmatter.Post) -> str:
         date_prefix = datetime.fromtimestamp(note_path.stat().st_mtime).strftime('%Y-%m-%d')
     
     # Create slug from filename
-    slug = re.sub(r'[^\w\-]', '-', note_path.stem.lower())
-    slug = re.sub(r'-+', '-', slug).strip('-')
+    slug = _SLUG_INVALID_RE.sub('-', note_path.stem.lower())
+    slug = _DASHES_RE.sub('-', slug).strip('-')
     
     return f"{date_prefix}--{slug}.md"
-
-
-def _is_para_vault() -> bool:
-    """Check if vault is using PARA structure."""
-    from .config import config
-    
-    para_folders = ['00_Inbox', '01_Templates', '02_Projects', '03_Areas', '04_Resources']
-    
-    for folder in para_folders:
-        if (config.vault_path / folder).exists():
-            return True
-    
-    return False
@@ -1,24 +1,120 @@
 
 """Module for migrating Obsidian vault to PARA methodology structure."""
 
+import os
 import re
+from copy import copy
 from datetime import datetime
+from functools import lru_cache, partial
+from itertools import chain
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Callable, Dict, FrozenSet, Optional, Tuple
 
 import frontmatter
 
-from .config import config
+from .config import config, PARA_FOLDERS
 from .link_manager import scan_and_update_links
+from .naming_utils import current_date, reset_current_date
 from .templates import create_templates
+from .vault_reader import iter_markdown_files, map_files, read_text
+from .writer import write_text
 
+# Filenames starting with an ISO date, e.g. 2024-01-15
+_DATE_ONLY_RE = re.compile(r'^\d{4}-\d{2}-\d{2}')
 
-def migrate_to_para(dry_run: bool = False) -> Dict[str, int]:
+# Filenames that already follow the YYYY-MM-DD--slug convention
+_DATE_PREFIX_RE = re.compile(r'^\d{4}-\d{2}-\d{2}--')
+
+_TITLE_INVALID_RE = re.compile(r'[^\w\s\-]')
+_SLUG_INVALID_RE = re.compile(r'[^\w\-]')
+_DASHES_RE = re.compile(r'-+')
+
+
+# Ordered (para_type, substrings) rules for infer_para_type; the first rule
+# with any substring present in the lowercased text wins
+_PATH_RULES = (
+    ('area', ('personal/', 'personal\\', '/personal', 'school/', 'school\\', '/school')),
+    ('resource', ('guides/', 'guides\\', '/guides', 'resources/', 'resources\\', '/resources')),
+    ('project', ('projects/', 'projects\\', '/projects')),
+    ('daily', ('daily/', 'daily\\', '/daily', 'journal/', 'journal\\', '/journal'))
+)
+
+_FILENAME_RULES = (
+    ('project', ('proj',)),  # 'proj' also matches 'project'
+    ('daily', ('daily', 'journal', 'log')),
+    ('resource', ('guide', 'reference', 'resource', 'manual', 'tutorial')),
+    ('area', ('area', 'responsibility'))
+)
+
+_CONTENT_RULES = (
+    ('project', ('project:', 'deadline:', 'deliverable:', 'milestone:')),
+    ('daily', ('daily note', 'today i', 'morning', 'evening reflection')),
+    ('resource', ('reference', 'guide:', 'tutorial:', 'how to', 'documentation')),
+    ('area', ('ongoing', 'responsibility', 'maintain', 'standard:'))
+)
+
+
+def _compile_any(rules: Tuple[Tuple[str, Tuple[str, ...]], ...]) -> re.Pattern:
+    """Compile every substring in a rule table into one alternation."""
+    substrings = [substring for _, group in rules for substring in group]
+    return re.compile('|'.join(map(re.escape, substrings)))
+
+
+# Single-pass rejection of paths and filenames that match no rule at all
+_PATH_ANY_RE = _compile_any(_PATH_RULES)
+_FILENAME_ANY_RE = _compile_any(_FILENAME_RULES)
+
+# Ordered (terms, folder) rules picking an area/resource subfolder
+_AREA_SUBFOLDERS = (
+    (('personal',), '03_Areas/Personal'),
+    (('school',), '03_Areas/School'),
+    (('work',), '03_Areas/Work')
+)
+
+_RESOURCE_SUBFOLDERS = (
+    (('guide', 'tutorial', 'how-to'), '04_Resources/Guides'),
+    (('tool', 'software', 'app'), '04_Resources/Tools'),
+    (('learn', 'course', 'study'), '04_Resources/Learning')
+)
+
+_FOLDER_TERMS = tuple(
+    term for rules in (_AREA_SUBFOLDERS, _RESOURCE_SUBFOLDERS) for terms, _ in rules for term in terms
+)
+
+# Terms searched for in note bodies
+_CONTENT_TERMS = tuple(term for _, terms in _CONTENT_RULES for term in terms)
+_RESOURCE_TERMS = tuple(term for terms, _ in _RESOURCE_SUBFOLDERS for term in terms)
+
+# Bodies longer than this are lowercased one window at a time for term
+# searches, so a multi-megabyte note is never copied whole
+LOWER_WINDOW_CHARS = 1 << 20
+
+
+# Marks frontmatter defaults that are filled in with today's date
+_TODAY = object()
+
+# Fields every migrated note gets, with their defaults, in frontmatter order
+_BASE_DEFAULTS = (
+    ('status', 'active'),
+    ('tags', []),
+    ('last_modified', _TODAY)
+)
+
+# Extra fields per PARA type
+_TYPE_DEFAULTS = {
+    'project': (('priority', 'medium'), ('deadline', '')),
+    'area': (('last_reviewed', _TODAY), ('review_frequency', 'weekly')),
+    'resource': (('category', ''), ('source', ''))
+}
+
+
+def migrate_to_para(dry_run: bool = False, jobs: int = 1) -> Dict[str, int]:
     """
     Complete migration of vault to PARA methodology structure.
     
     Args:
         dry_run: If True, only report what would be done
+        jobs: Number of worker processes used to process notes
         
     Returns:
         Dictionary with counts of operations performed
@@ -28,6 +124,9 @@ def migrate_to_para(dry_run: bool = False) -> Dict[str, int]:
     if dry_run:
         print("🧪 DRY RUN MODE - No files will be modified")
     
+    reset_current_date()
+    vault = config.vault_path
+    
     stats = {
         'files_processed': 0,
         'folders_created': 0,
@@ -55,24 +154,34 @@ def migrate_to_para(dry_run: bool = False) -> Dict[str, int]:
         # Step 3: Process all markdown files
         file_moves = {}  # Track file movements for link updates
         
-        for md_file in config.vault_path.rglob("*.md"):
-            if md_file.is_file() and not _is_template_file(md_file):
-                try:
-                    stats['files_processed'] += 1
-                    file_stats, old_path, new_path = process_para_file(md_file, dry_run)
-                    
-                    # Update stats
-                    for key, value in file_stats.items():
-                        if key in stats:
-                            stats[key] += value
-                    
-                    # Track file moves for link updates
-                    if old_path != new_path:
-                        file_moves[old_path] = new_path
-                        
-                except Exception as e:
-                    print(f"❌ Error processing {md_file}: {e}")
-                    stats['errors'] += 1
+        templates_prefix = os.path.join(vault, '01_Templates', '')
+        md_files = [
+            Path(entry.path) for entry in iter_markdown_files(vault)
+            if not _is_template_file(entry, templates_prefix)
+        ]
+        
+        results = map_files(partial(_migrate_one_file, dry_run=dry_run), md_files, jobs)
+        for md_file, (file_stats, old_path, new_path, error) in zip(md_files, results):
+            stats['files_processed'] += 1
+            
+            # Moves are applied here, one at a time in walk order, so parallel
+            # workers never race on the same destination
+            if error is None and new_path != old_path and not dry_run:
+                error = _move_note(old_path, new_path)
+            
+            if error is not None:
+                print(f"❌ Error processing {md_file}: {error}")
+                stats['errors'] += 1
+                continue
+            
+            # Update stats
+            for key, value in file_stats.items():
+                if key in stats:
+                    stats[key] += value
+            
+            # Track file moves for link updates
+            if new_path != old_path and not dry_run:
+                file_moves[old_path] = new_path
         
         # Step 4: Update wikilinks
         if file_moves:
@@ -119,9 +228,10 @@ def create_para_structure(dry_run: bool = False) -> Dict[str, int]:
     
     all_folders = para_folders + area_subfolders + resource_subfolders
     folders_created = 0
+    vault = config.vault_path
     
     for folder in all_folders:
-        folder_path = config.vault_path / folder
+        folder_path = vault / folder
         
         if not folder_path.exists():
             if not dry_run:
@@ -131,13 +241,27 @@ def create_para_structure(dry_run: bool = False) -> Dict[str, int]:
                 print(f"📁 Would create folder: {folder}")
             folders_created += 1
     
+    if folders_created and not dry_run:
+        config.invalidate_layout_cache()
+    
     return {'folders_created': folders_created}
 
 
-def process_para_file(file_path: Path, dry_run: bool = False) -> Tuple[Dict[str, int], Path, Path]:
+def process_para_file(
+    file_path: Path, dry_run: bool = False, content: Optional[str] = None
+) -> Tuple[Dict[str, int], Path, Path]:
     """
     Process a single file for PARA migration.
     
+    Frontmatter changes are saved in place. The move and rename are only
+    planned: the returned final path is where the note belongs, and
+    migrate_to_para moves it there.
+    
+    Args:
+        file_path: Path to the markdown file
+        dry_run: If True, only report what would be done
+        content: The file's text if it was already read, otherwise it is read here
+        
     Returns:
         (stats_dict, original_path, final_path)
     """
@@ -149,33 +273,32 @@ def process_para_file(file_path: Path, dry_run: bool = False) -> Tuple[Dict[str,
     
     original_path = file_path
     current_path = file_path
+    final_path = file_path
     
     try:
-        # Read and parse file
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+        # Read (unless read ahead) and parse file
+        if content is None:
+            content = read_text(file_path)
         
         post = frontmatter.loads(content)
         
+        # Determine the PARA type once; frontmatter and folder logic share it
+        if 'para_type' in post.metadata:
+            para_type = post.metadata['para_type']
+        else:
+            para_type = infer_para_type(post.content, file_path)
+        
         # Update frontmatter for PARA
-        if update_para_frontmatter(post, file_path):
+        if update_para_frontmatter(post, file_path, para_type):
             stats['frontmatter_updated'] = 1
-            if not dry_run:
-                _save_post(current_path, post)
         
-        # Determine PARA type and correct location
-        para_type = post.metadata.get('para_type', infer_para_type(post.content, file_path))
+        # Determine correct location
         correct_folder = get_para_folder(para_type, file_path, post)
         
         # Check if file needs moving
         if correct_folder != current_path.parent:
             stats['files_moved'] = 1
-            if not dry_run:
-                correct_folder.mkdir(parents=True, exist_ok=True)
-                new_path = correct_folder / current_path.name
-                current_path.rename(new_path)
-                current_path = new_path
-            else:
+            if dry_run:
                 rel_old = current_path.relative_to(config.vault_path)
                 rel_new = correct_folder.relative_to(config.vault_path) / current_path.name
                 print(f"  📁 Would move: {rel_old} → {rel_new}")
@@ -184,158 +307,194 @@ def process_para_file(file_path: Path, dry_run: bool = False) -> Tuple[Dict[str,
         conventional_name = get_para_conventional_name(current_path, post)
         if conventional_name != current_path.name:
             stats['files_renamed'] = 1
-            if not dry_run:
-                final_path = current_path.parent / conventional_name
-                current_path.rename(final_path)
-                current_path = final_path
-            else:
+            if dry_run:
                 print(f"  📄 Would rename: {current_path.name} → {conventional_name}")
         
+        final_path = correct_folder / conventional_name
+        
+        if stats['frontmatter_updated'] and not dry_run:
+            _save_post(current_path, post)
+        
     except Exception as e:
         print(f"❌ Error processing {file_path}: {e}")
+        raise
+    
+    return stats, original_path, final_path
+
+
+def _move_note(file_path: Path, new_path: Path) -> Optional[str]:
+    """
+    Rename/move a note to its planned path without overwriting another note.
+    
+    Every PARA folder was created up front by create_para_structure, so the
+    move is a single rename call.
+    
+    Returns:
+        None on success, otherwise an error message
+    """
+    # samefile lets a case-only rename through on case-insensitive filesystems
+    if os.path.lexists(new_path) and not os.path.samefile(file_path, new_path):
+        return f"{new_path} already exists, not moving"
+    try:
+        os.rename(file_path, new_path)
+    except OSError as e:
+        return str(e)
+    return None
+
+
+def _migrate_one_file(
+    file_path: Path, content: Optional[str], dry_run: bool
+) -> Tuple[Dict[str, int], Path, Path, Optional[str]]:
+    """
+    Process one file for migrate_to_para, returning the error instead of raising.
     
-    return stats, original_path, current_path
+    Returns:
+        (stats_dict, original_path, final_path, error_message_or_None)
+    """
+    try:
+        file_stats, old_path, new_path = process_para_file(file_path, dry_run, content)
+        return file_stats, old_path, new_path, None
+    except Exception as e:
+        return {}, file_path, file_path, str(e)
 
 
 def infer_para_type(content: str, file_path: Path) -> str:
     """
     Infer PARA type from content, filename, and folder location.
     """
-    path_str = str(file_path).lower()
-    content_lower = content.lower()
     filename = file_path.stem.lower()
     
     # Check for daily notes (date patterns)
-    if re.match(r'^\d{4}-\d{2}-\d{2}', filename):
+    if _DATE_ONLY_RE.match(filename):
         return 'daily'
     
     # Check folder patterns for legacy migration
-    if any(pattern in path_str for pattern in ['personal/', 'personal\\', '/personal']):
-        return 'area'
-    elif any(pattern in path_str for pattern in ['school/', 'school\\', '/school']):
-        return 'area'
-    elif any(pattern in path_str for pattern in ['guides/', 'guides\\', '/guides', 'resources/', 'resources\\', '/resources']):
-        return 'resource'
-    elif any(pattern in path_str for pattern in ['projects/', 'projects\\', '/projects']):
-        return 'project'
-    elif any(pattern in path_str for pattern in ['daily/', 'daily\\', '/daily', 'journal/', 'journal\\', '/journal']):
-        return 'daily'
+    path_str = str(file_path).lower()
+    para_type = _classify(path_str, _PATH_RULES, _PATH_ANY_RE)
+    if para_type:
+        return para_type
     
     # Check filename patterns
-    if any(keyword in filename for keyword in ['project', 'proj']):
-        return 'project'
-    elif any(keyword in filename for keyword in ['daily', 'journal', 'log']):
-        return 'daily'
-    elif any(keyword in filename for keyword in ['guide', 'reference', 'resource', 'manual', 'tutorial']):
-        return 'resource'
-    elif any(keyword in filename for keyword in ['area', 'responsibility']):
-        return 'area'
-    
-    # Check content patterns
-    if any(phrase in content_lower for phrase in ['project:', 'deadline:', 'deliverable:', 'milestone:']):
-        return 'project'
-    elif any(phrase in content_lower for phrase in ['daily note', 'today i', 'morning', 'evening reflection']):
-        return 'daily'
-    elif any(phrase in content_lower for phrase in ['reference', 'guide:', 'tutorial:', 'how to', 'documentation']):
-        return 'resource'
-    elif any(phrase in content_lower for phrase in ['ongoing', 'responsibility', 'maintain', 'standard:']):
-        return 'area'
+    para_type = _classify(filename, _FILENAME_RULES, _FILENAME_ANY_RE)
+    if para_type:
+        return para_type
+    
+    # Check content patterns; only now pay for lowercasing the body.
+    # Plain substring search beats a regex scan on long bodies.
+    in_content = _content_term_checker(content, _CONTENT_TERMS)
+    for para_type, terms in _CONTENT_RULES:
+        if any(in_content(term) for term in terms):
+            return para_type
     
     # Default to inbox for unclassified notes
     return 'inbox'
 
 
+def _classify(
+    text: str, rules: Tuple[Tuple[str, Tuple[str, ...]], ...], any_re: Optional[re.Pattern] = None
+) -> Optional[str]:
+    """Return the para_type of the first rule with a substring in text, or None."""
+    if any_re is not None and not any_re.search(text):
+        return None
+    for para_type, substrings in rules:
+        if any(substring in text for substring in substrings):
+            return para_type
+    return None
+
+
 def get_para_folder(para_type: str, file_path: Path, post: frontmatter.Post) -> Path:
     """Get the correct PARA folder for a given type and context."""
-    base_folders = {
-        'inbox': '00_Inbox',
-        'template': '01_Templates',
-        'project': '02_Projects',
-        'area': '03_Areas',
-        'resource': '04_Resources',
-        'daily': '05_Daily',
-        'archive': '06_Archive'
-    }
-    
-    base_folder = base_folders.get(para_type, '00_Inbox')
+    vault = config.vault_path
     
     # Handle specific subfolder logic
     if para_type == 'area':
-        # Try to determine area category from path or content
-        path_str = str(file_path).lower()
-        if 'personal' in path_str:
-            return config.vault_path / "03_Areas" / "Personal"
-        elif 'school' in path_str:
-            return config.vault_path / "03_Areas" / "School"
-        elif 'work' in path_str:
-            return config.vault_path / "03_Areas" / "Work"
-        else:
-            return config.vault_path / "03_Areas"
+        # Try to determine area category from path
+        in_path = _path_term_checker(file_path)
+        for terms, folder in _AREA_SUBFOLDERS:
+            if any(in_path(term) for term in terms):
+                return _vault_folder(vault, folder)
+        return _vault_folder(vault, "03_Areas")
     
     elif para_type == 'resource':
-        # Try to determine resource category
-        path_str = str(file_path).lower()
-        content = post.content.lower()
+        # Try to determine resource category from path or content
+        in_path = _path_term_checker(file_path)
+        in_content = _content_term_checker(post.content, _RESOURCE_TERMS)
         
-        if any(term in path_str or term in content for term in ['guide', 'tutorial', 'how-to']):
-            return config.vault_path / "04_Resources" / "Guides"
-        elif any(term in path_str or term in content for term in ['tool', 'software', 'app']):
-            return config.vault_path / "04_Resources" / "Tools"
-        elif any(term in path_str or term in content for term in ['learn', 'course', 'study']):
-            return config.vault_path / "04_Resources" / "Learning"
-        else:
-            return config.vault_path / "04_Resources" / "Reference"
+        for terms, folder in _RESOURCE_SUBFOLDERS:
+            if any(in_path(term) or in_content(term) for term in terms):
+                return _vault_folder(vault, folder)
+        return _vault_folder(vault, "04_Resources/Reference")
     
-    return config.vault_path / base_folder
+    return _vault_folder(vault, PARA_FOLDERS.get(para_type, '00_Inbox'))
 
 
-def update_para_frontmatter(post: frontmatter.Post, file_path: Path) -> bool:
-    """Update frontmatter with PARA-specific fields."""
-    modified = False
+@lru_cache(maxsize=64)
+def _vault_folder(vault: Path, folder: str) -> Path:
+    """Return vault / folder, reusing the same Path object for every note."""
+    return vault / folder
+
+
+def _path_term_checker(file_path: Path) -> Callable[[str], bool]:
+    """
+    Return a predicate telling whether a folder term occurs in the lowercased path.
     
-    # Ensure basic PARA fields exist
-    if 'para_type' not in post.metadata:
-        post.metadata['para_type'] = infer_para_type(post.content, file_path)
-        modified = True
+    None of the terms contain a path separator, so a term is in the full path
+    exactly when it is in the parent directory or in the filename. The parent
+    scan is cached, so notes in the same folder share it.
+    """
+    parent_terms = _parent_folder_terms(str(file_path.parent).lower())
+    name = file_path.name.lower()
+    return lambda term: term in parent_terms or term in name
+
+
+def _content_term_checker(content: str, terms: Tuple[str, ...]) -> Callable[[str], bool]:
+    """
+    Return a predicate telling whether a term occurs in the lowercased content.
     
-    if 'status' not in post.metadata:
-        post.metadata['status'] = 'active'
-        modified = True
+    Bodies up to LOWER_WINDOW_CHARS are lowercased once. Longer ones are
+    lowercased in overlapping windows, recording which of the given terms
+    each window contains, so only one window is copied at a time.
+    """
+    if len(content) <= LOWER_WINDOW_CHARS:
+        content_lower = content.lower()
+        return lambda term: term in content_lower
+    
+    # Windows overlap by one less than the longest term, so no match is split
+    overlap = max(map(len, terms)) - 1
+    step = LOWER_WINDOW_CHARS - overlap
+    found = set()
+    for start in range(0, len(content), step):
+        window = content[start:start + LOWER_WINDOW_CHARS].lower()
+        found.update(term for term in terms if term in window)
+    return found.__contains__
+
+
+@lru_cache(maxsize=4096)
+def _parent_folder_terms(parent: str) -> FrozenSet[str]:
+    """Return the folder terms that occur in a lowercased parent directory path."""
+    return frozenset(term for term in _FOLDER_TERMS if term in parent)
+
+
+def update_para_frontmatter(post: frontmatter.Post, file_path: Path, para_type: Optional[str] = None) -> bool:
+    """Update frontmatter with PARA-specific fields, using para_type if it was already inferred."""
+    modified = False
     
-    if 'tags' not in post.metadata:
-        post.metadata['tags'] = []
-        modified = True
+    metadata = post.metadata
     
-    if 'last_modified' not in post.metadata:
-        post.metadata['last_modified'] = datetime.now().strftime('%Y-%m-%d')
+    # Ensure basic PARA fields exist
+    if 'para_type' not in metadata:
+        metadata['para_type'] = para_type or infer_para_type(post.content, file_path)
         modified = True
     
-    # Add type-specific fields
-    para_type = post.metadata.get('para_type', 'inbox')
-    
-    if para_type == 'project':
-        if 'priority' not in post.metadata:
-            post.metadata['priority'] = 'medium'
-            modified = True
-        if 'deadline' not in post.metadata:
-            post.metadata['deadline'] = ''
-            modified = True
-    
-    elif para_type == 'area':
-        if 'last_reviewed' not in post.metadata:
-            post.metadata['last_reviewed'] = datetime.now().strftime('%Y-%m-%d')
-            modified = True
-        if 'review_frequency' not in post.metadata:
-            post.metadata['review_frequency'] = 'weekly'
-            modified = True
-    
-    elif para_type == 'resource':
-        if 'category' not in post.metadata:
-            post.metadata['category'] = ''
-            modified = True
-        if 'source' not in post.metadata:
-            post.metadata['source'] = ''
-            modified = True
+    # Add base and type-specific fields
+    type_defaults = _TYPE_DEFAULTS.get(metadata['para_type'], ())
+    for key, default in chain(_BASE_DEFAULTS, type_defaults):
+        if key in metadata:
+            continue
+        if default is _TODAY:
+            default = current_date()
+        metadata[key] = copy(default)
+        modified = True
     
     return modified
 
@@ -346,12 +505,12 @@ def get_para_conventional_name(file_path: Path, post: frontmatter.Post) -> str:
     para_type = post.metadata.get('para_type', 'inbox')
     
     # Don't rename if already has good PARA naming
-    if re.match(r'^\d{4}-\d{2}-\d{2}--', current_name) and para_type == 'daily':
+    if _DATE_PREFIX_RE.match(current_name) and para_type == 'daily':
         return current_name
     
     # For daily notes, ensure date prefix
     if para_type == 'daily':
-        date_str = post.metadata.get('date_created', datetime.now().strftime('%Y-%m-%d'))
+        date_str = post.metadata.get('date_created', current_date())
         if isinstance(date_str, str):
             try:
                 date_obj = datetime.fromisoformat(date_str.replace('Z', '+00:00'))
@@ -363,26 +522,34 @@ def get_para_conventional_name(file_path: Path, post: frontmatter.Post) -> str:
         
         # Create slug from existing name or title
         title = post.metadata.get('title', file_path.stem)
-        slug = re.sub(r'[^\w\-]', '-', title.lower())
-        slug = re.sub(r'-+', '-', slug).strip('-')
+        slug = _SLUG_INVALID_RE.sub('-', title.lower())
+        slug = _DASHES_RE.sub('-', slug).strip('-')
         
         return f"{date_prefix}--{slug}.md"
     
     # For other types, use title case
     title = post.metadata.get('title', file_path.stem)
-    normalized = re.sub(r'[^\w\s\-]', '', title)
+    normalized = _TITLE_INVALID_RE.sub('', title)
     normalized = ' '.join(word.capitalize() for word in normalized.split())
     normalized = normalized.replace(' ', '_')
     
     return f"{normalized}.md"
 
 
-def _is_template_file(file_path: Path) -> bool:
-    """Check if file is a template."""
-    return '01_Templates' in str(file_path) or 'template' in file_path.stem.lower()
+def _is_template_file(entry: os.DirEntry, templates_prefix: str) -> bool:
+    """
+    Check if a markdown file found by the vault walk is a template.
+    
+    Args:
+        entry: Directory entry of the markdown file
+        templates_prefix: Path of the vault's templates folder, ending in a separator
+        
+    Returns:
+        True if the file lives in the templates folder or is named like a template
+    """
+    return entry.path.startswith(templates_prefix) or 'template' in entry.name.lower()
 
 
 def _save_post(file_path: Path, post: frontmatter.Post) -> None:
     """Save frontmatter post to file."""
-    with open(file_path, 'w', encoding='utf-8') as f:
-        f.write(frontmatter.dumps(post))
+    write_text(file_path, frontmatter.dumps(post))
@@ -1,15 +1,19 @@
 
 """Module for summarizing observation notes and generating insights."""
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import Dict, Any, Optional, Tuple
 
 import frontmatter
 
 from .vault_reader import get_observation_notes, read_note_content
 from .gpt_client import gpt_client
 
+# Number of threads reading observation notes ahead of the GPT requests
+READ_AHEAD_WORKERS = 4
+
 
 def process_observation_notes(days: int = 7) -> Dict[str, Any]:
     """
@@ -31,45 +35,39 @@ def process_observation_notes(days: int = 7) -> Dict[str, Any]:
             "date_range": f"{datetime.now().strftime('%Y-%m-%d')} (no notes found)"
         }
     
+    notes = []
+    
+    def note_contents():
+        # Notes are read on a small thread pool and handed over as they arrive,
+        # so disk reads overlap with GPT batches that are already in flight
+        with ThreadPoolExecutor(max_workers=READ_AHEAD_WORKERS) as executor:
+            for note in executor.map(_load_note, note_files):
+                if note is not None:
+                    notes.append(note)
+                    yield note[1]
+    
+    # Get GPT analyses for all notes concurrently
+    analyses = gpt_client.summarize_many(note_contents())
+    
     summaries = []
     
-    for file_path in note_files:
-        try:
-            # Read and parse the note
-            content = read_note_content(file_path)
-            
-            # Try to parse frontmatter, fall back to plain text
-            try:
-                post = frontmatter.loads(content)
-                note_content = post.content
-                metadata = post.metadata
-            except:
-                note_content = content
-                metadata = {}
-            
-            # Skip empty notes
-            if not note_content.strip():
-                continue
-            
-            # Get GPT analysis
-            analysis = gpt_client.summarize(note_content)
-            
-            summaries.append({
-                "file_name": file_path.name,
-                "file_path": str(file_path),
-                "metadata": metadata,
-                "analysis": analysis,
-                "word_count": len(note_content.split())
-            })
-            
-        except Exception as e:
-            print(f"Warning: Failed to process {file_path}: {str(e)}")
+    for (file_path, note_content, metadata), analysis in zip(notes, analyses):
+        if isinstance(analysis, Exception):
+            print(f"Warning: Failed to process {file_path}: {str(analysis)}")
             continue
-    
-    # Calculate date range
+        
+        summaries.append({
+            "file_name": file_path.name,
+            "file_path": str(file_path),
+            "metadata": metadata,
+            "analysis": analysis,
+            "word_count": len(note_content.split())
+        })
+    
+    # Calculate date range; note_files is sorted newest first, so only the ends are stat'ed
     if note_files:
-        oldest_mtime = min(f.stat().st_mtime for f in note_files)
-        newest_mtime = max(f.stat().st_mtime for f in note_files)
+        oldest_mtime = note_files[-1].stat().st_mtime
+        newest_mtime = note_files[0].stat().st_mtime
         oldest_date = datetime.fromtimestamp(oldest_mtime).strftime('%Y-%m-%d')
         newest_date = datetime.fromtimestamp(newest_mtime).strftime('%Y-%m-%d')
         date_range = f"{oldest_date} to {newest_date}"
@@ -84,6 +82,40 @@ def process_observation_notes(days: int = 7) -> Dict[str, Any]:
     }
 
 
+def _load_note(file_path: Path) -> Optional[Tuple[Path, str, Dict[str, Any]]]:
+    """
+    Read and parse a single observation note.
+    
+    Args:
+        file_path: Path to the note file
+        
+    Returns:
+        (file_path, note_content, metadata), or None if the note is empty or unreadable
+    """
+    try:
+        # Read and parse the note
+        content = read_note_content(file_path)
+        
+        # Try to parse frontmatter, fall back to plain text
+        try:
+            post = frontmatter.loads(content)
+            note_content = post.content
+            metadata = post.metadata
+        except:
+            note_content = content
+            metadata = {}
+        
+        # Skip empty notes
+        if not note_content.strip():
+            return None
+        
+        return file_path, note_content, metadata
+    
+    except Exception as e:
+        print(f"Warning: Failed to process {file_path}: {str(e)}")
+        return None
+
+
 def generate_weekly_review_markdown(processed_data: Dict[str, Any]) -> str:
     """
     Generate markdown content for the weekly review.
@@ -95,8 +127,10 @@ def generate_weekly_review_markdown(processed_data: Dict[str, Any]) -> str:
         Formatted markdown string for the weekly review
     """
     now = datetime.now()
+    summaries = processed_data['summaries']
     
-    markdown = f"""# Weekly Review - {now.strftime('%Y-%m-%d')}
+    # Sections are collected in a list and joined once at the end
+    parts = [f"""# Weekly Review - {now.strftime('%Y-%m-%d')}
 
 ## Overview
 - **Period**: {processed_data['period']}
@@ -106,56 +140,39 @@ def generate_weekly_review_markdown(processed_data: Dict[str, Any]) -> str:
 
 ---
 
-"""
+"""]
     
-    if not processed_data['summaries']:
-        markdown += "## No Observations Found\n\nNo observation notes were found for the specified time period.\n"
-        return markdown
+    if not summaries:
+        parts.append("## No Observations Found\n\nNo observation notes were found for the specified time period.\n")
+        return ''.join(parts)
     
-    markdown += "## Individual Note Summaries\n\n"
+    parts.append("## Individual Note Summaries\n\n")
+    parts.extend(_render_note(i, summary) for i, summary in enumerate(summaries, 1))
     
-    for i, summary in enumerate(processed_data['summaries'], 1):
-        analysis = summary['analysis']
-        markdown += f"""### {i}. {summary['file_name']}
-
-**Summary**: {analysis['summary']}
-
-**Hypothesis**: {analysis['hypothesis']}
-
-**Follow-up Question**: {analysis['follow_up_question']}
-
-**Word Count**: {summary['word_count']}
+    # Generate overall insights section
+    parts.append(f"""## Overall Insights
 
----
+### Key Themes
+Based on {len(summaries)} observations:
 
-"""
-    
-    # Generate overall insights section
-    markdown += "## Overall Insights\n\n"
+""")
     
     # Extract common themes (simple keyword analysis)
-    all_summaries = [s['analysis']['summary'] for s in processed_data['summaries']]
-    all_hypotheses = [s['analysis']['hypothesis'] for s in processed_data['summaries']]
+    parts.extend(
+        f"- **Note {i}**: {summary['analysis']['summary'][:100]}...\n"
+        for i, summary in enumerate(summaries, 1)
+    )
     
-    markdown += f"""### Key Themes
-Based on {len(processed_data['summaries'])} observations:
-
-"""
-    
-    for i, summary in enumerate(processed_data['summaries'], 1):
-        markdown += f"- **Note {i}**: {summary['analysis']['summary'][:100]}...\n"
-    
-    markdown += f"""
+    parts.append("""
 
 ### Research Questions
 The following questions emerged from this week's observations:
 
-"""
+""")
     
-    for i, summary in enumerate(processed_data['summaries'], 1):
-        markdown += f"- {summary['analysis']['follow_up_question']}\n"
+    parts.extend(f"- {summary['analysis']['follow_up_question']}\n" for summary in summaries)
     
-    markdown += f"""
+    parts.append("""
 
 ### Next Steps
 1. Review the follow-up questions above
@@ -165,6 +182,24 @@ The following questions emerged from this week's observations:
 ---
 
 *Generated by Obsidian Agent v1.0.0*
-"""
+""")
     
-    return markdown
+    return ''.join(parts)
+
+
+def _render_note(index: int, summary: Dict[str, Any]) -> str:
+    """Render one note's section of the weekly review."""
+    analysis = summary['analysis']
+    return f"""### {index}. {summary['file_name']}
+
+**Summary**: {analysis['summary']}
+
+**Hypothesis**: {analysis['hypothesis']}
+
+**Follow-up Question**: {analysis['follow_up_question']}
+
+**Word Count**: {summary['word_count']}
+
+---
+
+"""
@@ -1,46 +1,14 @@
 
 """Module for generating and managing Obsidian vault templates."""
 
-from datetime import datetime
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict
 
 from .config import config
+from .writer import write_text
 
-
-def create_templates() -> Dict[str, Path]:
-    """
-    Create all PARA methodology templates in the vault.
-    
-    Returns:
-        Dictionary mapping template names to their file paths
-    """
-    templates_path = config.vault_path / "01_Templates"
-    templates_path.mkdir(parents=True, exist_ok=True)
-    
-    templates = {
-        "Note_Template.md": _get_note_template(),
-        "Project_Template.md": _get_project_template(),
-        "Daily_Template.md": _get_daily_template(),
-        "Area_Template.md": _get_area_template(),
-        "Resource_Template.md": _get_resource_template()
-    }
-    
-    created_files = {}
-    
-    for filename, content in templates.items():
-        file_path = templates_path / filename
-        with open(file_path, 'w', encoding='utf-8') as f:
-            f.write(content)
-        created_files[filename] = file_path
-        print(f"✓ Created template: {file_path}")
-    
-    return created_files
-
-
-def _get_note_template() -> str:
-    """Generate the basic note template."""
-    return """---
+# Basic note template
+NOTE_TEMPLATE = """---
 title: "{{title}}"
 date_created: {{date:YYYY-MM-DD}}
 last_modified: {{date:YYYY-MM-DD}}
@@ -70,10 +38,8 @@ links: []
 *Created: {{date:YYYY-MM-DD HH:mm}}*
 """
 
-
-def _get_project_template() -> str:
-    """Generate the project template."""
-    return """---
+# Project template
+PROJECT_TEMPLATE = """---
 title: "{{title}}"
 date_created: {{date:YYYY-MM-DD}}
 last_modified: {{date:YYYY-MM-DD}}
@@ -117,10 +83,8 @@ links: []
 *Created: {{date:YYYY-MM-DD HH:mm}}*
 """
 
-
-def _get_daily_template() -> str:
-    """Generate the daily note template."""
-    return """---
+# Daily note template
+DAILY_TEMPLATE = """---
 title: "{{date:YYYY-MM-DD}}"
 date_created: {{date:YYYY-MM-DD}}
 last_modified: {{date:YYYY-MM-DD}}
@@ -164,10 +128,8 @@ mood: ""
 *Daily Note | {{date:YYYY-MM-DD}}*
 """
 
-
-def _get_area_template() -> str:
-    """Generate the area template."""
-    return """---
+# Area template
+AREA_TEMPLATE = """---
 title: "{{title}}"
 date_created: {{date:YYYY-MM-DD}}
 last_modified: {{date:YYYY-MM-DD}}
@@ -223,10 +185,8 @@ links: []
 *Area: {{title}} | Last Reviewed: {{last_reviewed}}*
 """
 
-
-def _get_resource_template() -> str:
-    """Generate the resource template."""
-    return """---
+# Resource template
+RESOURCE_TEMPLATE = """---
 title: "{{title}}"
 date_created: {{date:YYYY-MM-DD}}
 last_modified: {{date:YYYY-MM-DD}}
@@ -270,3 +230,34 @@ links: []
 ---
 *Resource | Category: {{category}} | Source: {{source}}*
 """
+
+# Template files created in 01_Templates, by filename
+TEMPLATES = {
+    "Note_Template.md": NOTE_TEMPLATE,
+    "Project_Template.md": PROJECT_TEMPLATE,
+    "Daily_Template.md": DAILY_TEMPLATE,
+    "Area_Template.md": AREA_TEMPLATE,
+    "Resource_Template.md": RESOURCE_TEMPLATE
+}
+
+
+def create_templates() -> Dict[str, Path]:
+    """
+    Create all PARA methodology templates in the vault.
+    
+    Returns:
+        Dictionary mapping template names to their file paths
+    """
+    templates_path = config.vault_path / "01_Templates"
+    templates_path.mkdir(parents=True, exist_ok=True)
+    config.invalidate_layout_cache()
+    
+    created_files = {}
+    
+    for filename, content in TEMPLATES.items():
+        file_path = templates_path / filename
+        write_text(file_path, content)
+        created_files[filename] = file_path
+        print(f"✓ Created template: {file_path}")
+    
+    return created_files
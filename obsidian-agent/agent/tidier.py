@@ -1,29 +1,43 @@
 
 """Module for tidying and organizing Obsidian vault files."""
 
+import json
+import os
+from functools import partial
 from pathlib import Path
-from typing import Dict
+from typing import Dict, List, Optional, Set, Tuple
 
 import frontmatter
 
-from .config import config
+from .config import AGENT_DIR_NAME, config
 from .frontmatter_handler import ensure_frontmatter, normalize_tags
 from .file_organizer import get_correct_folder
-from .naming_utils import get_conventional_name
+from .naming_utils import get_conventional_name, reset_current_date
+from .vault_reader import iter_markdown_files, map_files, read_text
+from .writer import write_text
 
+# Destination folders already created during the current run (per process)
+_ensured_folders: Set[Path] = set()
 
-def tidy_vault(dry_run: bool = False) -> Dict[str, int]:
+# File in the agent folder recording the notes the last tidy left in place,
+# with their (mtime_ns, size), so unchanged notes are skipped on the next run
+TIDY_CACHE_NAME = "tidier-cache.json"
+
+
+def tidy_vault(dry_run: bool = False, jobs: int = 1) -> Dict[str, int]:
     """
     Tidy the entire Obsidian vault by organizing markdown files.
     
     Args:
         dry_run: If True, only report what would be done without making changes
+        jobs: Number of worker processes used to process notes
         
     Returns:
         Dictionary with counts of different operations performed
     """
-    if not config.vault_path.exists():
-        raise ValueError(f"Vault path does not exist: {config.vault_path}")
+    vault = config.vault_path
+    if not vault.exists():
+        raise ValueError(f"Vault path does not exist: {vault}")
     
     stats = {
         'files_processed': 0,
@@ -31,42 +45,79 @@ def tidy_vault(dry_run: bool = False) -> Dict[str, int]:
         'files_moved': 0,
         'files_renamed': 0,
         'tags_normalized': 0,
+        'files_unchanged': 0,
         'errors': 0
     }
     
-    print(f"🔍 Scanning vault: {config.vault_path}")
+    print(f"🔍 Scanning vault: {vault}")
     if dry_run:
         print("🧪 DRY RUN MODE - No files will be modified")
     
-    # Walk through all markdown files in the vault
-    for md_file in config.vault_path.rglob("*.md"):
-        if md_file.is_file():
-            try:
-                stats['files_processed'] += 1
-                changes = process_note_file(md_file, dry_run)
-                
-                # Update stats
-                for key, value in changes.items():
-                    if key in stats:
-                        stats[key] += value
-                        
-            except Exception as e:
-                print(f"❌ Error processing {md_file}: {e}")
-                stats['errors'] += 1
+    _ensured_folders.clear()
+    reset_current_date()
+    
+    # Notes untouched since the last tidy are skipped, unless the vault layout changed
+    layout = 'para' if config.is_para_vault else 'type'
+    cache = _load_tidy_cache(vault, layout)
+    tidied = {}
+    
+    # Collect all markdown files in the vault, then process them (in parallel if requested)
+    md_files = []
+    for entry in iter_markdown_files(vault):
+        signature = _file_signature(entry)
+        if signature is not None and cache.get(entry.path) == signature:
+            tidied[entry.path] = signature
+            stats['files_processed'] += 1
+            stats['files_unchanged'] += 1
+        else:
+            md_files.append(Path(entry.path))
+    
+    results = map_files(partial(_tidy_one_file, dry_run=dry_run), md_files, jobs)
+    for md_file, (changes, new_path, error) in zip(md_files, results):
+        stats['files_processed'] += 1
+        
+        # Renames and moves are applied here, one at a time in walk order, so
+        # parallel workers never race on the same destination
+        if error is None and new_path != md_file and not dry_run:
+            error = _move_note(md_file, new_path)
+        
+        if error is not None:
+            print(f"❌ Error processing {md_file}: {error}")
+            stats['errors'] += 1
+            continue
+        
+        # Update stats
+        for key, value in changes.items():
+            if key in stats:
+                stats[key] += value
+        
+        signature = _file_signature(new_path)
+        if signature is not None:
+            tidied[str(new_path)] = signature
+    
+    if not dry_run:
+        _save_tidy_cache(vault, layout, tidied)
     
     return stats
 
 
-def process_note_file(note_path: Path, dry_run: bool = False) -> Dict[str, int]:
+def process_note_file(
+    note_path: Path, dry_run: bool = False, content: Optional[str] = None
+) -> Tuple[Dict[str, int], Path]:
     """
     Process a single note file and apply tidying operations.
     
+    Frontmatter changes are saved in place. The rename and move are only
+    planned: the returned path is where the note belongs, and tidy_vault
+    moves it there.
+    
     Args:
         note_path: Path to the markdown file
         dry_run: If True, only report what would be done
+        content: The file's text if it was already read, otherwise it is read here
         
     Returns:
-        Dictionary with counts of operations performed on this file
+        Tuple of (counts of operations for this file, path the note should end up at)
     """
     changes = {
         'frontmatter_added': 0,
@@ -76,9 +127,9 @@ def process_note_file(note_path: Path, dry_run: bool = False) -> Dict[str, int]:
     }
     
     try:
-        # Read the file
-        with open(note_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+        # Read the file unless it was read ahead
+        if content is None:
+            content = read_text(note_path)
         
         # Parse frontmatter
         post = frontmatter.loads(content)
@@ -86,48 +137,123 @@ def process_note_file(note_path: Path, dry_run: bool = False) -> Dict[str, int]:
         # Ensure frontmatter exists
         if ensure_frontmatter(post, note_path):
             changes['frontmatter_added'] = 1
-            if not dry_run:
-                _save_note(note_path, post)
-            else:
+            if dry_run:
                 print(f"  📝 Would add frontmatter to: {note_path.name}")
         
         # Normalize tags
         if normalize_tags(post):
             changes['tags_normalized'] = 1
-            if not dry_run:
-                _save_note(note_path, post)
-            else:
+            if dry_run:
                 print(f"  🏷️  Would normalize tags in: {note_path.name}")
         
+        # Save once if either step changed the note
+        if (changes['frontmatter_added'] or changes['tags_normalized']) and not dry_run:
+            _save_note(note_path, post)
+        
         # Check if file needs renaming
         new_name = get_conventional_name(note_path, post)
         if new_name != note_path.name:
             changes['files_renamed'] = 1
-            if not dry_run:
-                new_path = note_path.parent / new_name
-                note_path.rename(new_path)
-                note_path = new_path
-            else:
+            if dry_run:
                 print(f"  📄 Would rename: {note_path.name} → {new_name}")
         
-        # Check if file needs moving
+        # Check if file needs moving (the folder only depends on the parent directory)
         correct_folder = get_correct_folder(post, note_path)
         if correct_folder != note_path.parent:
             changes['files_moved'] = 1
-            if not dry_run:
-                correct_folder.mkdir(parents=True, exist_ok=True)
-                new_path = correct_folder / note_path.name
-                note_path.rename(new_path)
-            else:
+            if dry_run:
                 rel_old = note_path.relative_to(config.vault_path)
-                rel_new = correct_folder.relative_to(config.vault_path) / note_path.name
+                rel_new = correct_folder.relative_to(config.vault_path) / new_name
                 print(f"  📁 Would move: {rel_old} → {rel_new}")
+        
+        new_path = correct_folder / new_name
                 
     except Exception as e:
         print(f"❌ Error processing {note_path}: {e}")
         raise
     
-    return changes
+    return changes, new_path
+
+
+def _move_note(note_path: Path, new_path: Path) -> Optional[str]:
+    """
+    Rename/move a note to its planned path without overwriting another note.
+    
+    Returns:
+        None on success, otherwise an error message
+    """
+    # samefile lets a case-only rename through on case-insensitive filesystems
+    if os.path.lexists(new_path) and not os.path.samefile(note_path, new_path):
+        return f"{new_path} already exists, not moving"
+    try:
+        _ensure_folder(new_path.parent)
+        os.rename(note_path, new_path)
+    except OSError as e:
+        return str(e)
+    return None
+
+
+def _ensure_folder(folder: Path) -> None:
+    """Create a destination folder the first time this run moves a note into it."""
+    if folder not in _ensured_folders:
+        folder.mkdir(parents=True, exist_ok=True)
+        _ensured_folders.add(folder)
+
+
+def _tidy_one_file(
+    note_path: Path, content: Optional[str], dry_run: bool
+) -> Tuple[Optional[Dict[str, int]], Path, Optional[str]]:
+    """
+    Process one note for tidy_vault, returning the error instead of raising.
+    
+    Returns:
+        (changes, new_path, None) on success, (None, note_path, error_message) on failure
+    """
+    try:
+        changes, new_path = process_note_file(note_path, dry_run, content)
+        return changes, new_path, None
+    except Exception as e:
+        return None, note_path, str(e)
+
+
+def _file_signature(path) -> Optional[List[int]]:
+    """Return [mtime_ns, size] for a path or os.DirEntry, or None if it cannot be stat'ed."""
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return [st.st_mtime_ns, st.st_size]
+
+
+def _load_tidy_cache(vault: Path, layout: str) -> Dict[str, List[int]]:
+    """
+    Load the signatures of notes left tidy by the last run.
+    
+    Args:
+        vault: The vault root
+        layout: Vault layout the notes were tidied for; a different layout discards the cache
+        
+    Returns:
+        Mapping of note path to [mtime_ns, size], empty if there is no usable cache
+    """
+    try:
+        with open(vault / AGENT_DIR_NAME / TIDY_CACHE_NAME, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    
+    if not isinstance(data, dict) or data.get('layout') != layout:
+        return {}
+    return data.get('files', {})
+
+
+def _save_tidy_cache(vault: Path, layout: str, files: Dict[str, List[int]]) -> None:
+    """Replace the tidy cache atomically; failures only mean a full scan next time."""
+    try:
+        (vault / AGENT_DIR_NAME).mkdir(exist_ok=True)
+        write_text(vault / AGENT_DIR_NAME / TIDY_CACHE_NAME, json.dumps({'layout': layout, 'files': files}))
+    except OSError:
+        pass
 
 
 def _save_note(note_path: Path, post: frontmatter.Post) -> None:
@@ -138,5 +264,4 @@ def _save_note(note_path: Path, post: frontmatter.Post) -> None:
         note_path: Path to save the file
         post: The frontmatter Post object to save
     """
-    with open(note_path, 'w', encoding='utf-8') as f:
-        f.write(frontmatter.dumps(post))
+    write_text(note_path, frontmatter.dumps(post))
@@ -2,12 +2,124 @@
 """Module for reading and filtering Obsidian vault files."""
 
 import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime, timedelta
+from operator import itemgetter
 from pathlib import Path
-from typing import List
+from typing import Callable, Iterator, List, Optional, Tuple, TypeVar
 
 from .config import config
 
+T = TypeVar('T')
+
+# Below this many files a process pool costs more to start than it saves
+PARALLEL_MIN_FILES = 8
+
+# Number of files handed to a worker process at a time
+PARALLEL_CHUNK_SIZE = 64
+
+# Threads reading notes ahead of a serial run, and how many files they may get ahead
+READ_AHEAD_WORKERS = 4
+READ_AHEAD_DEPTH = 128
+
+# Threads issuing stat calls for observation notes, which overlap well on network drives
+STAT_WORKERS = 16
+
+
+def iter_markdown_files(root: Path) -> Iterator[os.DirEntry]:
+    """
+    Recursively yield the markdown files below a directory.
+    
+    Uses an explicit os.scandir stack instead of Path.rglob so file types come
+    from the cached directory entries rather than a stat call per path.
+    
+    Args:
+        root: Directory to walk
+        
+    Returns:
+        Iterator of os.DirEntry objects for every ``*.md`` file
+    """
+    stack = [str(root)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.name.endswith('.md') and entry.is_file():
+                        yield entry
+        except OSError:
+            # Unreadable directories are skipped, as with rglob
+            continue
+
+
+def map_files(
+    func: Callable[[Path, Optional[str]], T], paths: List[Path], jobs: int = 1
+) -> Iterator[T]:
+    """
+    Apply a per-file function to every path, optionally across worker processes.
+    
+    ``func`` is called as ``func(path, content)``. When files are processed
+    serially they are read ahead on a few threads, so disk reads overlap the
+    parsing of earlier notes and ``content`` holds the file's text. Worker
+    processes read their own files and get ``content=None``, as does any file
+    the read-ahead could not read, so ``func`` must read the file itself then.
+    
+    Results are yielded in input order. ``func`` must be picklable (a
+    module-level function or a functools.partial of one) when ``jobs > 1``.
+    
+    Args:
+        func: Function called with each path and its pre-read content
+        paths: Files to process
+        jobs: Number of worker processes; 1 processes files serially and 0 uses every CPU
+        
+    Returns:
+        Iterator of results, one per path
+    """
+    if jobs == 0:
+        jobs = os.cpu_count() or 1
+    if jobs <= 1 or len(paths) < PARALLEL_MIN_FILES:
+        for path, content in read_ahead(paths):
+            yield func(path, content)
+        return
+    
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        yield from executor.map(func, paths, [None] * len(paths), chunksize=PARALLEL_CHUNK_SIZE)
+
+
+def read_ahead(paths: List[Path]) -> Iterator[Tuple[Path, Optional[str]]]:
+    """
+    Yield each path with its text, reading files ahead on a small thread pool.
+    
+    At most READ_AHEAD_DEPTH reads are in flight, so memory stays bounded
+    however large the vault is.
+    
+    Args:
+        paths: Files to read
+        
+    Returns:
+        Iterator of (path, content) in input order; content is None if the read failed
+    """
+    with ThreadPoolExecutor(max_workers=READ_AHEAD_WORKERS) as executor:
+        pending = deque()
+        for path in paths:
+            pending.append((path, executor.submit(_try_read_text, path)))
+            if len(pending) >= READ_AHEAD_DEPTH:
+                done_path, future = pending.popleft()
+                yield done_path, future.result()
+        while pending:
+            done_path, future = pending.popleft()
+            yield done_path, future.result()
+
+
+def _try_read_text(file_path: Path) -> Optional[str]:
+    """Read a file for read_ahead, leaving any error to the caller's own read."""
+    try:
+        return read_text(file_path)
+    except (OSError, UnicodeDecodeError):
+        return None
+
 
 def get_observation_notes(days: int = 7) -> List[Path]:
     """
@@ -17,7 +129,7 @@ def get_observation_notes(days: int = 7) -> List[Path]:
         days: Number of days to look back for notes
         
     Returns:
-        List of Path objects for observation note files
+        List of Path objects for observation note files, newest first
         
     Raises:
         ValueError: If vault path doesn't exist or observations folder not found
@@ -30,25 +142,69 @@ def get_observation_notes(days: int = 7) -> List[Path]:
             "Please check your vault structure."
         )
     
-    # Calculate the cutoff date
-    cutoff_date = datetime.now() - timedelta(days=days)
+    # Calculate the cutoff as a timestamp so it compares directly with st_mtime
+    cutoff = (datetime.now() - timedelta(days=days)).timestamp()
     
-    observation_files = []
+    # Walk through all markdown files in the observations directory; one
+    # stat per file serves both the date filter and the sort key
+    entries = list(iter_markdown_files(observations_path))
+    if len(entries) < PARALLEL_MIN_FILES:
+        mtimes = map(_entry_mtime, entries)
+    else:
+        with ThreadPoolExecutor(max_workers=STAT_WORKERS) as executor:
+            mtimes = list(executor.map(_entry_mtime, entries))
     
-    # Walk through all markdown files in the observations directory
-    for file_path in observations_path.rglob("*.md"):
-        if file_path.is_file():
-            # Get file modification time
-            mtime = datetime.fromtimestamp(file_path.stat().st_mtime)
-            
-            # Include files modified within the specified days
-            if mtime >= cutoff_date:
-                observation_files.append(file_path)
+    # Include files modified within the specified days
+    observation_files = [
+        (mtime, Path(entry.path)) for entry, mtime in zip(entries, mtimes) if mtime >= cutoff
+    ]
     
     # Sort by modification time, newest first
-    observation_files.sort(key=lambda x: x.stat().st_mtime, reverse=True)
+    observation_files.sort(key=itemgetter(0), reverse=True)
+    
+    return [file_path for _, file_path in observation_files]
+
+
+def _entry_mtime(entry: os.DirEntry) -> float:
+    """Return a directory entry's modification time."""
+    return entry.stat().st_mtime
+
+
+def read_text(file_path: Path, encoding: str = 'utf-8') -> str:
+    """
+    Read a whole text file with a single open/fstat/read/close sequence.
+    
+    Skips the buffered text-mode wrapper that open() builds for every file,
+    while keeping its universal-newline behavior.
+    
+    Args:
+        file_path: Path to the file
+        encoding: Encoding used to decode the file
+        
+    Returns:
+        The decoded file content
+        
+    Raises:
+        OSError: If the file cannot be read
+        UnicodeDecodeError: If the content is not valid in ``encoding``
+    """
+    fd = os.open(file_path, os.O_RDONLY)
+    try:
+        size = os.fstat(fd).st_size
+        data = os.read(fd, size + 1)
+        # Regular files come back whole in one read unless they grew after fstat
+        while len(data) > size:
+            chunk = os.read(fd, 65536)
+            if not chunk:
+                break
+            data += chunk
+    finally:
+        os.close(fd)
     
-    return observation_files
+    text = data.decode(encoding)
+    if '\r' in text:
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    return text
 
 
 def read_note_content(file_path: Path) -> str:
@@ -62,9 +218,7 @@ def read_note_content(file_path: Path) -> str:
         The content of the note as a string
     """
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            return f.read()
+        return read_text(file_path)
     except UnicodeDecodeError:
         # Fallback to latin-1 encoding if utf-8 fails
-        with open(file_path, 'r', encoding='latin-1') as f:
-            return f.read()
+        return read_text(file_path, encoding='latin-1')
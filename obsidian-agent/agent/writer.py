@@ -1,6 +1,9 @@
 
 """Module for writing weekly review files back to the Obsidian vault."""
 
+import os
+import stat
+import threading
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
@@ -8,6 +11,56 @@ from typing import Optional
 from .config import config
 
 
+def write_text(file_path: Path, text: str) -> None:
+    """
+    Atomically write text to a file as UTF-8 with raw os.write calls.
+    
+    The content goes to a temporary file in the same folder, which then
+    replaces the target with os.replace, so a crash mid-write never leaves a
+    half-written note. Encodes once and skips the buffered text-mode wrapper
+    that open() builds, so a small note is written with a single write syscall.
+    An existing file keeps its permissions, and a symlinked note is updated
+    through the link.
+    
+    Args:
+        file_path: Path of the file to create or overwrite
+        text: The content to write
+    """
+    target = os.fspath(file_path)
+    mode = None
+    try:
+        st = os.lstat(target)
+        if stat.S_ISLNK(st.st_mode):
+            target = os.path.realpath(target)
+            st = os.stat(target)
+        mode = stat.S_IMODE(st.st_mode)
+    except FileNotFoundError:
+        pass
+    
+    # The temporary name is unique per process and thread, so concurrent
+    # writers of the same file never share (and publish) each other's temp file
+    directory, name = os.path.split(target)
+    tmp_path = os.path.join(directory, f".{name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    
+    data = memoryview(text.encode('utf-8'))
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        try:
+            if mode is not None:
+                os.fchmod(fd, mode)
+            while data:
+                data = data[os.write(fd, data):]
+        finally:
+            os.close(fd)
+        os.replace(tmp_path, target)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
 def write_weekly_review(markdown: str, date_str: Optional[str] = None) -> Path:
     """
     Write a weekly review markdown file to the vault.
@@ -37,8 +90,7 @@ def write_weekly_review(markdown: str, date_str: Optional[str] = None) -> Path:
     
     try:
         # Write the markdown content
-        with open(file_path, 'w', encoding='utf-8') as f:
-            f.write(markdown)
+        write_text(file_path, markdown)
         
         print(f"✓ Weekly review written to: {file_path}")
         return file_path
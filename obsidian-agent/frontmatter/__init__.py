@@ -1,20 +1,45 @@
+import re
 from dataclasses import dataclass, field
 from typing import Dict
 
+import yaml
+
+# libyaml-backed loader/dumper when PyYAML was built with it, pure Python otherwise
+_Loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+_Dumper = getattr(yaml, 'CSafeDumper', yaml.SafeDumper)
+
+# Leading YAML block delimited by --- lines
+_FENCE_RE = re.compile(r'\A---[ \t]*\r?\n(.*?)^---[ \t]*(?:\r?\n|\Z)', re.DOTALL | re.MULTILINE)
+
+
 @dataclass
 class Post:
     content: str
     metadata: Dict[str, any] = field(default_factory=dict)
+    # Whether the note was loaded with a --- header, which dumps() then keeps
+    # even when empty and follows with the body exactly as it was
+    fenced: bool = field(default=False, repr=False)
 
 
+# Only the YAML header is loaded; the body is sliced from the original text
+# verbatim and never re-serialized
 def loads(text: str) -> Post:
-    if text.startswith('---'):
-        end = text.find('---', 3)
-        if end != -1:
-            body = text[end+3:].lstrip('\n')
-            return Post(body, {})
-    return Post(text, {})
+    match = _FENCE_RE.match(text)
+    if match is None:
+        return Post(text, {})
+    metadata = yaml.load(match.group(1), Loader=_Loader)
+    body = text[match.end():]
+    return Post(body, metadata if isinstance(metadata, dict) else {}, fenced=True)
 
 
 def dumps(post: Post) -> str:
-    return post.content
+    if not post.metadata and not post.fenced:
+        return post.content
+    header = ''
+    if post.metadata:
+        header = yaml.dump(post.metadata, Dumper=_Dumper, default_flow_style=False,
+                           sort_keys=False, allow_unicode=True)
+    if post.fenced:
+        return f"---\n{header}---\n{post.content}"
+    # A header added to a note that had none is set off by a blank line
+    return f"---\n{header}---\n\n{post.content}"
@@ -6,5 +6,9 @@ class _Chat:
     def __init__(self):
         self.completions = _ChatCompletions()
 
+class OpenAI:
+    def __init__(self, *args, **kwargs):
+        self.chat = _Chat()
+
 chat = _Chat()
 api_key = None
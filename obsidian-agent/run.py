@@ -7,14 +7,20 @@ Usage:
     python run.py summarize --days 30
     python run.py tidy
     python run.py tidy --dry-run
+    python run.py tidy --jobs 4
+    python run.py tidy --jobs 0
     python run.py migrate-para
     python run.py migrate-para --dry-run
     python run.py create-templates
     python run.py fix-links
     python run.py backup-vault
+    python run.py backup-vault migrate-para fix-links
 """
 
+import functools
 import sys
+from io import StringIO
+from itertools import islice
 from pathlib import Path
 
 import click
@@ -22,19 +28,113 @@ import click
 # Add the current directory to Python path so we can import agent modules
 sys.path.insert(0, str(Path(__file__).parent))
 
-from agent.config import config
-from agent.summarizer import process_observation_notes, generate_weekly_review_markdown
-from agent.writer import write_weekly_review, ensure_vault_structure
-from agent.tidier import tidy_vault
-from agent.para_migrator import migrate_to_para
-from agent.templates import create_templates
-from agent.link_manager import generate_broken_links_report
+# Command modules (and the OpenAI client behind the summarizer) are imported
+# inside each command, so --help and the other commands don't pay for them
+from agent.config import Config, config
 
 
-@click.group()
-def cli():
+def with_error_handling(command):
+    """
+    Report a command's errors and exit with status 1 instead of a traceback.
+    
+    Args:
+        command: The CLI command function to wrap
+        
+    Returns:
+        The wrapped function
+    """
+    @functools.wraps(command)
+    def wrapper(*args, **kwargs):
+        try:
+            return command(*args, **kwargs)
+        except ValueError as e:
+            print(f"❌ Configuration error: {e}")
+            sys.exit(1)
+        except Exception as e:
+            print(f"❌ Error: {e}")
+            sys.exit(1)
+    
+    return wrapper
+
+
+def get_config(ctx: click.Context) -> Config:
+    """
+    Return the configuration the command group validated for this chain.
+    
+    Args:
+        ctx: The running command's context
+        
+    Returns:
+        The validated configuration
+        
+    Raises:
+        ValueError: If the configuration failed validation
+    """
+    obj = ctx.find_object(dict)
+    if 'config_error' in obj:
+        raise obj['config_error']
+    return obj['config']
+
+
+def confirm_migration(ctx: click.Context, param: click.Parameter, dry_run: bool) -> bool:
+    """
+    Ask before migrating, while the chained commands are still being parsed.
+    
+    Click parses every command of a chain before running the first one, so
+    confirming here happens before any command in the chain has run.
+    Cancelling stops the whole chain.
+    
+    Returns:
+        The --dry-run value, unchanged
+    """
+    if dry_run or ctx.resilient_parsing or 'config_error' in ctx.find_object(dict):
+        return dry_run
+    
+    confirm = click.confirm(
+        "⚠️  This will restructure your entire vault. Continue?", 
+        default=False
+    )
+    if not confirm:
+        print("Migration cancelled.")
+        ctx.exit()
+    return dry_run
+
+
+def print_preview(text: str, max_lines: int) -> None:
+    """
+    Print the first lines of a generated document between rulers.
+    
+    Reads only as far as the preview needs instead of splitting the whole
+    document into lines.
+    
+    Args:
+        text: The document to preview
+        max_lines: Number of lines to show before truncating with "..."
+    """
+    buffer = StringIO(text)
+    lines = ["\n📖 Preview:", "=" * 50]
+    lines.extend(line.rstrip('\n') for line in islice(buffer, max_lines))
+    if buffer.readline():
+        lines.append("...")
+    lines.append("=" * 50)
+    print("\n".join(lines))
+
+
+# Several commands can be chained in one invocation, sharing one process
+# (and its imports and caches) instead of starting Python once per command
+@click.group(chain=True)
+@click.pass_context
+def cli(ctx: click.Context):
     """Obsidian Agent - Summarize observation notes and generate weekly reviews."""
-    pass
+    # Validated once for the whole chain. A failure is kept rather than raised,
+    # so --help still works without configuration; commands raise it instead
+    obj = ctx.ensure_object(dict)
+    try:
+        config.validate()
+    except ValueError as e:
+        obj['config_error'] = e
+    else:
+        obj['config'] = config
 
 
 @cli.command()
@@ -49,57 +149,45 @@ def cli():
     help='Date string for output file (default: today)',
     type=str
 )
-def summarize(days: int, output_date: str):
+@click.pass_context
+@with_error_handling
+def summarize(ctx: click.Context, days: int, output_date: str):
     """Generate a weekly review from recent observation notes."""
     
-    try:
-        # Validate configuration
-        config.validate()
-        
-        print(f"🔍 Scanning for observation notes from the last {days} days...")
-        print(f"📁 Vault path: {config.vault_path}")
-        
-        # Ensure vault structure exists
-        ensure_vault_structure()
-        
-        # Process observation notes
-        processed_data = process_observation_notes(days)
-        
-        print(f"📝 Found {processed_data['notes_processed']} notes to process")
-        print(f"📅 Date range: {processed_data['date_range']}")
-        
-        if processed_data['notes_processed'] == 0:
-            print("⚠️  No observation notes found in the specified time period.")
-            print(f"   Check that notes exist in: {config.vault_path}/3-Areas/Mind-Body-System/observations/")
-            return
-        
-        # Generate markdown content
-        print("🤖 Generating weekly review with GPT-4...")
-        markdown_content = generate_weekly_review_markdown(processed_data)
-        
-        # Write the review file
-        review_file = write_weekly_review(markdown_content, output_date)
-        
-        print(f"✅ Weekly review complete!")
-        print(f"📄 Review saved to: {review_file}")
-        
-        # Show a preview of the content
-        lines = markdown_content.split('\n')
-        preview_lines = lines[:10]
-        print("\n📖 Preview:")
-        print("=" * 50)
-        for line in preview_lines:
-            print(line)
-        if len(lines) > 10:
-            print("...")
-        print("=" * 50)
-        
-    except ValueError as e:
-        print(f"❌ Configuration error: {e}")
-        sys.exit(1)
-    except Exception as e:
-        print(f"❌ Error: {e}")
-        sys.exit(1)
+    config = get_config(ctx)
+    
+    print(f"🔍 Scanning for observation notes from the last {days} days...")
+    print(f"📁 Vault path: {config.vault_path}")
+    
+    from agent.summarizer import process_observation_notes, generate_weekly_review_markdown
+    from agent.writer import write_weekly_review, ensure_vault_structure
+    
+    # Ensure vault structure exists
+    ensure_vault_structure()
+    
+    # Process observation notes
+    processed_data = process_observation_notes(days)
+    
+    print(f"📝 Found {processed_data['notes_processed']} notes to process")
+    print(f"📅 Date range: {processed_data['date_range']}")
+    
+    if processed_data['notes_processed'] == 0:
+        print("⚠️  No observation notes found in the specified time period.")
+        print(f"   Check that notes exist in: {config.vault_path}/3-Areas/Mind-Body-System/observations/")
+        return
+    
+    # Generate markdown content
+    print("🤖 Generating weekly review with GPT-4...")
+    markdown_content = generate_weekly_review_markdown(processed_data)
+    
+    # Write the review file
+    review_file = write_weekly_review(markdown_content, output_date)
+    
+    print(f"✅ Weekly review complete!")
+    print(f"📄 Review saved to: {review_file}")
+    
+    # Show a preview of the content
+    print_preview(markdown_content, 10)
 
 
 @cli.command()
@@ -108,201 +196,185 @@ def summarize(days: int, output_date: str):
     is_flag=True,
     help='Show what would be done without making changes'
 )
-def tidy(dry_run: bool):
+@click.option(
+    '--jobs',
+    default=1,
+    help='Number of worker processes used to process notes, 0 for one per CPU (default: 1)',
+    type=click.IntRange(min=0)
+)
+@click.pass_context
+@with_error_handling
+def tidy(ctx: click.Context, dry_run: bool, jobs: int):
     """Tidy and organize markdown files in the Obsidian vault."""
     
-    try:
-        # Validate configuration
-        config.validate()
-        
-        print(f"🧹 Tidying Obsidian vault...")
-        print(f"📁 Vault path: {config.vault_path}")
-        
-        # Run tidying process
-        stats = tidy_vault(dry_run=dry_run)
-        
-        # Print summary
-        print("\n📊 Tidying Summary:")
-        print("=" * 40)
-        print(f"Files processed: {stats['files_processed']}")
-        print(f"Frontmatter added: {stats['frontmatter_added']}")
-        print(f"Files moved: {stats['files_moved']}")
-        print(f"Files renamed: {stats['files_renamed']}")
-        print(f"Tags normalized: {stats['tags_normalized']}")
-        
-        if stats['errors'] > 0:
-            print(f"Errors encountered: {stats['errors']}")
-        
-        if dry_run:
-            print("\n🧪 This was a dry run - no files were modified.")
-            print("   Run without --dry-run to apply changes.")
-        else:
-            print(f"\n✅ Tidying complete!")
-        
-    except ValueError as e:
-        print(f"❌ Configuration error: {e}")
-        sys.exit(1)
-    except Exception as e:
-        print(f"❌ Error: {e}")
-        sys.exit(1)
+    config = get_config(ctx)
+    
+    print(f"🧹 Tidying Obsidian vault...")
+    print(f"📁 Vault path: {config.vault_path}")
+    
+    from agent.tidier import tidy_vault
+    
+    # Run tidying process
+    stats = tidy_vault(dry_run=dry_run, jobs=jobs)
+    
+    # Print summary, written in one go
+    summary = [
+        "\n📊 Tidying Summary:",
+        "=" * 40,
+        f"Files processed: {stats['files_processed']}",
+        f"Frontmatter added: {stats['frontmatter_added']}",
+        f"Files moved: {stats['files_moved']}",
+        f"Files renamed: {stats['files_renamed']}",
+        f"Tags normalized: {stats['tags_normalized']}",
+        f"Unchanged since last tidy: {stats['files_unchanged']}"
+    ]
+    
+    if stats['errors'] > 0:
+        summary.append(f"Errors encountered: {stats['errors']}")
+    
+    if dry_run:
+        summary.append("\n🧪 This was a dry run - no files were modified.")
+        summary.append("   Run without --dry-run to apply changes.")
+    else:
+        summary.append("\n✅ Tidying complete!")
+    
+    print("\n".join(summary))
 
 
 @cli.command()
 @click.option(
     '--dry-run',
     is_flag=True,
-    help='Show what would be done without making changes'
+    help='Show what would be done without making changes',
+    callback=confirm_migration
 )
-def migrate_para(dry_run: bool):
-    """Migrate vault to PARA methodology structure."""
+@click.option(
+    '--jobs',
+    default=1,
+    help='Number of worker processes used to process notes, 0 for one per CPU (default: 1)',
+    type=click.IntRange(min=0)
+)
+@click.pass_context
+@with_error_handling
+def migrate_para(ctx: click.Context, dry_run: bool, jobs: int):
+    """
+    Migrate vault to PARA methodology structure.
     
-    try:
-        # Validate configuration
-        config.validate()
-        
-        print(f"🚀 Migrating vault to PARA methodology...")
-        print(f"📁 Vault path: {config.vault_path}")
-        
-        if not dry_run:
-            confirm = click.confirm(
-                "⚠️  This will restructure your entire vault. Continue?", 
-                default=False
-            )
-            if not confirm:
-                print("Migration cancelled.")
-                return
-        
-        # Run PARA migration
-        stats = migrate_to_para(dry_run=dry_run)
-        
-        # Print summary
-        print("\n📊 PARA Migration Summary:")
-        print("=" * 50)
-        print(f"Files processed: {stats['files_processed']}")
-        print(f"Folders created: {stats['folders_created']}")
-        print(f"Files moved: {stats['files_moved']}")
-        print(f"Files renamed: {stats['files_renamed']}")
-        print(f"Frontmatter updated: {stats['frontmatter_updated']}")
-        print(f"Templates created: {stats['templates_created']}")
-        print(f"Links updated: {stats['links_updated']}")
-        
-        if stats['errors'] > 0:
-            print(f"Errors encountered: {stats['errors']}")
-        
-        if dry_run:
-            print("\n🧪 This was a dry run - no files were modified.")
-            print("   Run without --dry-run to apply changes.")
-        else:
-            print(f"\n✅ PARA migration complete!")
-            print("📖 Check the 01_Templates folder for new templates.")
-            print("🔗 Run 'fix-links' if you notice any broken wikilinks.")
-        
-    except ValueError as e:
-        print(f"❌ Configuration error: {e}")
-        sys.exit(1)
-    except Exception as e:
-        print(f"❌ Error: {e}")
-        sys.exit(1)
+    Unless --dry-run is given, asks for confirmation before the first
+    command of the chain runs.
+    """
+    
+    config = get_config(ctx)
+    
+    print(f"🚀 Migrating vault to PARA methodology...")
+    print(f"📁 Vault path: {config.vault_path}")
+    
+    from agent.para_migrator import migrate_to_para
+    
+    # Run PARA migration
+    stats = migrate_to_para(dry_run=dry_run, jobs=jobs)
+    
+    # Print summary, written in one go
+    summary = [
+        "\n📊 PARA Migration Summary:",
+        "=" * 50,
+        f"Files processed: {stats['files_processed']}",
+        f"Folders created: {stats['folders_created']}",
+        f"Files moved: {stats['files_moved']}",
+        f"Files renamed: {stats['files_renamed']}",
+        f"Frontmatter updated: {stats['frontmatter_updated']}",
+        f"Templates created: {stats['templates_created']}",
+        f"Links updated: {stats['links_updated']}"
+    ]
+    
+    if stats['errors'] > 0:
+        summary.append(f"Errors encountered: {stats['errors']}")
+    
+    if dry_run:
+        summary.append("\n🧪 This was a dry run - no files were modified.")
+        summary.append("   Run without --dry-run to apply changes.")
+    else:
+        summary.append("\n✅ PARA migration complete!")
+        summary.append("📖 Check the 01_Templates folder for new templates.")
+        summary.append("🔗 Run 'fix-links' if you notice any broken wikilinks.")
+    
+    print("\n".join(summary))
 
 
 @cli.command()
-def create_templates():
+@click.pass_context
+@with_error_handling
+def create_templates(ctx: click.Context):
     """Create PARA methodology templates in the vault."""
     
-    try:
-        # Validate configuration
-        config.validate()
-        
-        print(f"📝 Creating PARA templates...")
-        print(f"📁 Vault path: {config.vault_path}")
-        
-        # Create templates
-        templates = create_templates()
-        
-        print(f"\n✅ Created {len(templates)} templates:")
-        for name, path in templates.items():
-            rel_path = path.relative_to(config.vault_path)
-            print(f"  📄 {rel_path}")
-        
-    except ValueError as e:
-        print(f"❌ Configuration error: {e}")
-        sys.exit(1)
-    except Exception as e:
-        print(f"❌ Error: {e}")
-        sys.exit(1)
+    config = get_config(ctx)
+    
+    print(f"📝 Creating PARA templates...")
+    print(f"📁 Vault path: {config.vault_path}")
+    
+    # The command function shadows the module's create_templates
+    from agent.templates import create_templates as create_vault_templates
+    
+    # Create templates
+    templates = create_vault_templates()
+    
+    print(f"\n✅ Created {len(templates)} templates:")
+    for name, path in templates.items():
+        rel_path = path.relative_to(config.vault_path)
+        print(f"  📄 {rel_path}")
 
 
 @cli.command()
-def fix_links():
+@click.pass_context
+@with_error_handling
+def fix_links(ctx: click.Context):
     """Generate a report of broken wikilinks in the vault."""
     
-    try:
-        # Validate configuration
-        config.validate()
-        
-        print(f"🔗 Scanning vault for broken wikilinks...")
-        print(f"📁 Vault path: {config.vault_path}")
-        
-        # Generate broken links report
-        report = generate_broken_links_report()
-        
-        # Save report to vault
-        report_path = config.vault_path / "broken-links-report.md"
-        with open(report_path, 'w', encoding='utf-8') as f:
-            f.write(report)
-        
-        print(f"📄 Report saved to: {report_path}")
-        
-        # Show preview
-        lines = report.split('\n')
-        preview_lines = lines[:20]
-        print("\n📖 Preview:")
-        print("=" * 50)
-        for line in preview_lines:
-            print(line)
-        if len(lines) > 20:
-            print("...")
-        print("=" * 50)
-        
-    except ValueError as e:
-        print(f"❌ Configuration error: {e}")
-        sys.exit(1)
-    except Exception as e:
-        print(f"❌ Error: {e}")
-        sys.exit(1)
+    config = get_config(ctx)
+    
+    print(f"🔗 Scanning vault for broken wikilinks...")
+    print(f"📁 Vault path: {config.vault_path}")
+    
+    from agent.link_manager import generate_broken_links_report
+    from agent.writer import write_text
+    
+    # Generate broken links report
+    report = generate_broken_links_report()
+    
+    # Save report to vault
+    report_path = config.vault_path / "broken-links-report.md"
+    write_text(report_path, report)
+    
+    print(f"📄 Report saved to: {report_path}")
+    
+    # Show preview
+    print_preview(report, 20)
 
 
 @cli.command()
-def backup_vault():
+@click.pass_context
+@with_error_handling
+def backup_vault(ctx: click.Context):
     """Create a backup of the vault before major operations."""
     
-    try:
-        # Validate configuration
-        config.validate()
-        
-        print(f"💾 Creating vault backup...")
-        print(f"📁 Vault path: {config.vault_path}")
-        
-        from datetime import datetime
-        import shutil
-        
-        # Create backup directory
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        backup_name = f"vault_backup_{timestamp}"
-        backup_path = config.vault_path.parent / backup_name
-        
-        # Copy vault
-        shutil.copytree(config.vault_path, backup_path)
-        
-        print(f"✅ Backup created: {backup_path}")
-        print(f"💡 Use this backup to restore if needed.")
-        
-    except ValueError as e:
-        print(f"❌ Configuration error: {e}")
-        sys.exit(1)
-    except Exception as e:
-        print(f"❌ Error: {e}")
-        sys.exit(1)
+    config = get_config(ctx)
+    
+    print(f"💾 Creating vault backup...")
+    print(f"📁 Vault path: {config.vault_path}")
+    
+    from datetime import datetime
+    from agent.backup import copy_tree
+    
+    # Create backup directory
+    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    backup_name = f"vault_backup_{timestamp}"
+    backup_path = config.vault_path.parent / backup_name
+    
+    # Copy vault
+    copy_tree(config.vault_path, backup_path)
+    
+    print(f"✅ Backup created: {backup_path}")
+    print(f"💡 Use this backup to restore if needed.")
 
 
 if __name__ == '__main__':
@@ -0,0 +1,82 @@
+
+"""Tests for backup module."""
+
+import errno
+import os
+from unittest.mock import patch
+
+import pytest
+
+from agent.backup import copy_tree
+
+
+class TestBackup:
+    """Test cases for vault backup functionality."""
+    
+    def test_copy_tree_copies_files_and_times(self, tmp_path):
+        """Test that copy_tree reproduces the tree with file contents and modification times."""
+        src = tmp_path / "vault"
+        (src / "notes" / "deep").mkdir(parents=True)
+        (src / "top.md").write_text("top")
+        (src / "notes" / "deep" / "bottom.md").write_text("bottom")
+        os.utime(src / "top.md", (1_600_000_000, 1_600_000_000))
+        
+        copied = copy_tree(src, tmp_path / "backup")
+        
+        assert copied == 2
+        assert (tmp_path / "backup" / "top.md").read_text() == "top"
+        assert (tmp_path / "backup" / "notes" / "deep" / "bottom.md").read_text() == "bottom"
+        assert (tmp_path / "backup" / "top.md").stat().st_mtime == 1_600_000_000
+    
+    def test_copy_tree_refuses_existing_destination(self, tmp_path):
+        """Test that copy_tree does not copy into a folder that already exists."""
+        (tmp_path / "vault").mkdir()
+        (tmp_path / "backup").mkdir()
+        
+        with pytest.raises(FileExistsError):
+            copy_tree(tmp_path / "vault", tmp_path / "backup")
+    
+    def test_copy_tree_falls_back_when_reflinks_are_unsupported(self, tmp_path):
+        """Test that files are copied normally when the filesystem cannot reflink."""
+        src = tmp_path / "vault"
+        src.mkdir()
+        (src / "note.md").write_text("content")
+        
+        unsupported = OSError(errno.EOPNOTSUPP, "Operation not supported")
+        with patch('agent.backup.sys.platform', 'linux'), \
+                patch('agent.backup.fcntl') as mock_fcntl:
+            mock_fcntl.ioctl.side_effect = unsupported
+            copy_tree(src, tmp_path / "backup")
+        
+        assert (tmp_path / "backup" / "note.md").read_text() == "content"
+    
+    def test_copy_tree_stops_cloning_after_reflinks_fail(self, tmp_path):
+        """Test that a filesystem without reflinks is only asked to clone once."""
+        src = tmp_path / "vault"
+        src.mkdir()
+        for i in range(10):
+            (src / f"note{i}.md").write_text(f"content {i}")
+        
+        unsupported = OSError(errno.EOPNOTSUPP, "Operation not supported")
+        with patch('agent.backup.sys.platform', 'linux'), \
+                patch('agent.backup.COPY_WORKERS', 1), \
+                patch('agent.backup.fcntl') as mock_fcntl:
+            mock_fcntl.ioctl.side_effect = unsupported
+            copy_tree(src, tmp_path / "backup")
+        
+        assert mock_fcntl.ioctl.call_count == 1
+        assert (tmp_path / "backup" / "note9.md").read_text() == "content 9"
+    
+    def test_copy_tree_does_not_clone_across_devices(self, tmp_path):
+        """Test that no reflink is attempted when src and dst are on different devices."""
+        src = tmp_path / "vault"
+        src.mkdir()
+        (src / "note.md").write_text("content")
+        
+        with patch('agent.backup.sys.platform', 'linux'), \
+                patch('agent.backup._can_clone', return_value=False), \
+                patch('agent.backup.fcntl') as mock_fcntl:
+            copy_tree(src, tmp_path / "backup")
+        
+        mock_fcntl.ioctl.assert_not_called()
+        assert (tmp_path / "backup" / "note.md").read_text() == "content"
@@ -7,6 +7,15 @@ from unittest.mock import patch, MagicMock
 from agent.gpt_client import GPTClient
 
 
+@pytest.fixture(autouse=True)
+def cache_in_tmp_path(tmp_path):
+    """Keep the summary cache out of whatever vault the environment configures."""
+    mock_config = MagicMock()
+    mock_config.vault_path = tmp_path
+    with patch('agent.gpt_client.config', mock_config):
+        yield
+
+
 class TestGPTClient:
     """Test cases for GPT client functionality."""
     
@@ -20,7 +29,7 @@ class TestGPTClient:
         HYPOTHESIS: This is a test hypothesis
         FOLLOW_UP: This is a test follow-up question
         """
-        mock_openai.chat.completions.create.return_value = mock_response
+        mock_openai.OpenAI.return_value.chat.completions.create.return_value = mock_response
         
         client = GPTClient()
         result = client.summarize("Test observation note")
@@ -36,6 +45,18 @@ class TestGPTClient:
         assert isinstance(result["hypothesis"], str)
         assert isinstance(result["follow_up_question"], str)
     
+    @patch('agent.gpt_client.openai')
+    def test_batch_requests_get_a_longer_timeout(self, mock_openai):
+        """Test that the request timeout grows with the number of notes in a batch."""
+        create = mock_openai.OpenAI.return_value.chat.completions.create
+        create.return_value.choices[0].message.content = "SUMMARY: S\nHYPOTHESIS: H\nFOLLOW_UP: Q?"
+        
+        client = GPTClient()
+        client._complete("prompt", max_tokens=500)
+        client._complete("prompt", max_tokens=2000)
+        
+        assert [call.kwargs["timeout"] for call in create.call_args_list] == [30, 120]
+    
     def test_parse_response_basic(self):
         """Test parsing of GPT response content."""
         client = GPTClient()
@@ -69,3 +90,118 @@ class TestGPTClient:
         assert "longer summary that spans multiple lines" in result["summary"]
         assert "hypothesis also spans multiple lines" in result["hypothesis"]
         assert "What about this question?" in result["follow_up_question"]
+    
+    def test_summarize_many_preserves_order_and_captures_errors(self):
+        """Test that concurrent summaries keep input order and report failures per note."""
+        client = GPTClient()
+        
+        def fake_summarize(text):
+            if text == "bad":
+                raise RuntimeError("Failed to get GPT response: boom")
+            return {"summary": text, "hypothesis": "", "follow_up_question": ""}
+        
+        with patch('agent.gpt_client.BATCH_SIZE', 1), \
+                patch.object(client, 'summarize', side_effect=fake_summarize):
+            results = client.summarize_many(["first", "bad", "third"])
+        
+        assert results[0]["summary"] == "first"
+        assert isinstance(results[1], RuntimeError)
+        assert results[2]["summary"] == "third"
+    
+    def test_parse_batch_response(self):
+        """Test parsing of a batched GPT response with numbered sections."""
+        client = GPTClient()
+        
+        content = """
+        SUMMARY_1: First summary
+        that continues
+        HYPOTHESIS_1: First hypothesis
+        FOLLOW_UP_1: First question?
+        SUMMARY_2: Second summary
+        HYPOTHESIS_2: Second hypothesis
+        FOLLOW_UP_2: Second question?
+        """
+        
+        results = client._parse_batch_response(content, 2)
+        
+        assert len(results) == 2
+        assert results[0]["summary"] == "First summary that continues"
+        assert results[0]["follow_up_question"] == "First question?"
+        assert results[1]["hypothesis"] == "Second hypothesis"
+    
+    def test_summarize_many_retries_notes_missing_from_batch(self):
+        """Test that notes the batched reply skipped are summarized individually."""
+        client = GPTClient()
+        
+        batch_result = [
+            {"summary": "Batched", "hypothesis": "", "follow_up_question": ""},
+            {"summary": "", "hypothesis": "", "follow_up_question": ""}
+        ]
+        single_result = {"summary": "Single", "hypothesis": "", "follow_up_question": ""}
+        
+        with patch.object(client, 'summarize_batch', return_value=batch_result), \
+                patch.object(client, 'summarize', return_value=single_result) as mock_single:
+            results = client.summarize_many(["one", "two"])
+        
+        assert [r["summary"] for r in results] == ["Batched", "Single"]
+        mock_single.assert_called_once_with("two")
+    
+    def test_summarize_many_retries_each_note_when_the_batch_fails(self):
+        """Test that a failed batch request falls back to one request per note."""
+        client = GPTClient()
+        
+        def summarize(text):
+            if text == "bad":
+                raise RuntimeError("boom")
+            return {"summary": text, "hypothesis": "H", "follow_up_question": "Q?"}
+        
+        with patch.object(client, 'summarize_batch', side_effect=RuntimeError("batch failed")), \
+                patch.object(client, 'summarize', side_effect=summarize):
+            results = client.summarize_many(["one", "bad", "three"])
+        
+        assert results[0]["summary"] == "one"
+        assert isinstance(results[1], RuntimeError)
+        assert results[2]["summary"] == "three"
+    
+    def test_summaries_are_cached_by_content(self, tmp_path):
+        """Test that a repeated note is answered from the on-disk cache."""
+        client = GPTClient()
+        
+        mock_config = MagicMock()
+        mock_config.vault_path = tmp_path
+        
+        response = """
+        SUMMARY: Cached summary
+        HYPOTHESIS: Cached hypothesis
+        FOLLOW_UP: Cached question?
+        """
+        
+        with patch('agent.gpt_client.config', mock_config), \
+                patch.object(client, '_complete', return_value=response) as mock_complete:
+            first = client.summarize("Same note")
+            second = client.summarize_many(["Same note"])
+        
+        mock_complete.assert_called_once()
+        assert second == [first]
+        assert first["summary"] == "Cached summary"
+        assert len(list((tmp_path / ".obsidian-agent" / "gpt-cache").iterdir())) == 1
+    
+    def test_repeated_summaries_are_served_from_memory(self, tmp_path):
+        """Test that a summary cached this run does not need its cache file."""
+        client = GPTClient()
+        
+        mock_config = MagicMock()
+        mock_config.vault_path = tmp_path
+        
+        response = "SUMMARY: Remembered\nHYPOTHESIS: H\nFOLLOW_UP: Q?"
+        
+        with patch('agent.gpt_client.config', mock_config), \
+                patch.object(client, '_complete', return_value=response) as mock_complete:
+            first = client.summarize("Same note")
+            for cache_file in (tmp_path / ".obsidian-agent" / "gpt-cache").iterdir():
+                cache_file.unlink()
+            second = client.summarize("Same note")
+        
+        mock_complete.assert_called_once()
+        assert second == first
+        assert second is not first
@@ -0,0 +1,63 @@
+"""Tests for the link manager module."""
+
+import pytest
+from pathlib import Path
+from unittest.mock import patch
+
+from agent.link_manager import scan_and_update_links, find_broken_links, scan_vault
+
+
+@pytest.fixture
+def vault(tmp_path):
+    """A small vault with one renamed note and one broken link."""
+    (tmp_path / "notes").mkdir()
+    (tmp_path / "notes" / "index.md").write_text(
+        "See [[old-name]], [[old-name|Display]] and [[missing]].", encoding='utf-8'
+    )
+    (tmp_path / "notes" / "New_Name.md").write_text("Renamed note.", encoding='utf-8')
+    
+    with patch('agent.link_manager.config') as mock_config:
+        mock_config.vault_path = tmp_path
+        yield tmp_path
+
+
+class TestLinkManager:
+    """Test cases for the link manager module."""
+    
+    def test_scan_and_update_links_rewrites_moved_links(self, vault):
+        """Test that links to moved files are rewritten, keeping display text."""
+        moves = {vault / "old-name.md": vault / "notes" / "New_Name.md"}
+        
+        stats = scan_and_update_links(moves)
+        
+        content = (vault / "notes" / "index.md").read_text(encoding='utf-8')
+        assert stats['links_found'] == 3
+        assert stats['links_updated'] == 2
+        assert "[[New_Name]]" in content
+        assert "[[New_Name|Display]]" in content
+        assert "[[missing]]" in content
+    
+    def test_scan_and_update_links_dry_run_leaves_files(self, vault):
+        """Test that a dry run reports updates without writing them."""
+        moves = {vault / "old-name.md": vault / "notes" / "New_Name.md"}
+        
+        stats = scan_and_update_links(moves, dry_run=True)
+        
+        content = (vault / "notes" / "index.md").read_text(encoding='utf-8')
+        assert stats['links_updated'] == 2
+        assert "[[old-name]]" in content
+    
+    def test_find_broken_links(self, vault):
+        """Test that links to notes that do not exist are reported."""
+        broken = find_broken_links()
+        
+        assert sorted(link for _, link in broken) == ["missing", "old-name", "old-name"]
+    
+    def test_scan_vault_checks_rewritten_links(self, vault):
+        """Test that a combined scan checks links after they have been rewritten."""
+        moves = {vault / "old-name.md": vault / "notes" / "New_Name.md"}
+        
+        stats, broken = scan_vault(moves)
+        
+        assert [link for _, link in broken] == ["missing"]
+        assert stats['broken_links'] == 1
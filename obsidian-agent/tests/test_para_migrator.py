@@ -5,7 +5,9 @@ import pytest
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
-from agent.para_migrator import infer_para_type, get_para_folder, update_para_frontmatter
+from agent.para_migrator import (
+    infer_para_type, get_para_folder, migrate_to_para, update_para_frontmatter, _content_term_checker
+)
 import frontmatter
 
 
@@ -96,6 +98,23 @@ class TestParaMigrator:
         result = get_para_folder('resource', note_path, post)
         assert result == Path("/vault/04_Resources/Guides")
     
+    @patch('agent.para_migrator.LOWER_WINDOW_CHARS', 8)
+    def test_content_term_checker_finds_terms_across_windows(self):
+        """Test that long bodies searched in windows find terms split by a window boundary."""
+        terms = ('alpha', 'beta', 'gamma')
+        # With 8-char windows overlapping by 4, windows start every 4 characters
+        contents = [
+            "xxxxxxALPHAxxxxxxxxx",     # spans the end of the first window
+            "xxxxxxxBetaxxxxxxxxx",     # starts inside the overlap
+            "xxxxxxxxxxxxxxxxxxGAMMA",  # at the very end of the body
+            "xxxxxxxxxxxxxxxxxxxxalph"  # truncated term only
+        ]
+        
+        for content in contents:
+            in_content = _content_term_checker(content, terms)
+            for term in terms:
+                assert in_content(term) == (term in content.lower()), (content, term)
+    
     def test_update_para_frontmatter_adds_required_fields(self):
         """Test that required PARA frontmatter fields are added."""
         post = frontmatter.Post("Some content")
@@ -156,3 +175,40 @@ class TestParaMigrator:
         assert post.metadata['status'] == 'completed'
         assert post.metadata['priority'] == 'high'
         assert post.metadata['deadline'] == '2024-12-31'
+    
+    @patch('agent.link_manager.config')
+    @patch('agent.templates.config')
+    @patch('agent.para_migrator.config')
+    def test_migrate_to_para_does_not_overwrite_on_name_clash(self, mock_config, mock_templates_config, mock_links_config, tmp_path):
+        """Test that a note whose PARA destination is already taken is left in place and counted as an error."""
+        for mock in (mock_config, mock_templates_config, mock_links_config):
+            mock.vault_path = tmp_path
+        (tmp_path / "a").mkdir()
+        (tmp_path / "b").mkdir()
+        (tmp_path / "a" / "note.md").write_text("---\npara_type: inbox\n---\n\none")
+        (tmp_path / "b" / "note.md").write_text("---\npara_type: inbox\n---\n\ntwo")
+        
+        stats = migrate_to_para()
+        
+        inbox_notes = list((tmp_path / "00_Inbox").iterdir())
+        assert [note.name for note in inbox_notes] == ["Note.md"]
+        assert stats['files_moved'] == 1
+        assert stats['errors'] == 1
+        assert len(list(tmp_path.glob("[ab]/*.md"))) == 1
+    
+    @patch('agent.para_migrator._save_post', side_effect=OSError("disk full"))
+    @patch('agent.link_manager.config')
+    @patch('agent.templates.config')
+    @patch('agent.para_migrator.config')
+    def test_migrate_to_para_counts_failed_notes_and_leaves_them_in_place(self, mock_config, mock_templates_config, mock_links_config, mock_save, tmp_path):
+        """Test that a note that fails part way is counted as an error and not moved."""
+        for mock in (mock_config, mock_templates_config, mock_links_config):
+            mock.vault_path = tmp_path
+        (tmp_path / "a").mkdir()
+        (tmp_path / "a" / "note.md").write_text("---\npara_type: inbox\n---\n\none")
+        
+        stats = migrate_to_para()
+        
+        assert stats['errors'] == 1
+        assert stats['files_moved'] == 0
+        assert (tmp_path / "a" / "note.md").exists()
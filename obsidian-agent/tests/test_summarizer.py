@@ -37,11 +37,14 @@ class TestSummarizer:
         mock_read_content.return_value = "# Test Note\n\nThis is test content."
         
         # Mock GPT response
-        mock_gpt.summarize.return_value = {
-            "summary": "Test summary",
-            "hypothesis": "Test hypothesis",
-            "follow_up_question": "Test question"
-        }
+        mock_gpt.summarize_many.side_effect = lambda texts: [
+            {
+                "summary": "Test summary",
+                "hypothesis": "Test hypothesis",
+                "follow_up_question": "Test question"
+            }
+            for _ in texts
+        ]
         
         result = process_observation_notes(days=7)
         
@@ -6,59 +6,30 @@ from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 from agent.frontmatter_handler import infer_type_from_content, normalize_tags, ensure_frontmatter
+from agent.tidier import tidy_vault
 import frontmatter
 
+# Note paths shared by the type inference tests
+_NOTE = Path("/vault/notes/some-note.md")
+_OBSERVATIONS_FOLDER_NOTE = Path("/vault/3-Areas/Mind-Body-System/observations/note.md")
+_OBSERVATION_FILENAME_NOTE = Path("/vault/notes/observation-daily.md")
+_RANDOM_NOTE = Path("/vault/notes/random.md")
+
 
 class TestTidier:
     """Test cases for the tidier module."""
     
-    def test_infer_type_from_content_observation(self):
-        """Test that observation content is correctly identified."""
-        content = "I observed that the user behavior changed significantly today."
-        note_path = Path("/vault/notes/some-note.md")
-        
-        result = infer_type_from_content(content, note_path)
-        assert result == "observation"
-    
-    def test_infer_type_from_content_hypothesis(self):
-        """Test that hypothesis content is correctly identified."""
-        content = "Hypothesis: The new feature will increase user engagement by 20%."
-        note_path = Path("/vault/notes/some-note.md")
-        
-        result = infer_type_from_content(content, note_path)
-        assert result == "hypothesis"
-    
-    def test_infer_type_from_content_review(self):
-        """Test that review content is correctly identified."""
-        content = "Weekly review of progress and achievements this week."
-        note_path = Path("/vault/notes/some-note.md")
-        
-        result = infer_type_from_content(content, note_path)
-        assert result == "review"
-    
-    def test_infer_type_from_folder_path(self):
-        """Test that type is inferred from folder structure."""
-        content = "Some generic content here."
-        note_path = Path("/vault/3-Areas/Mind-Body-System/observations/note.md")
-        
-        result = infer_type_from_content(content, note_path)
-        assert result == "observation"
-    
-    def test_infer_type_from_filename(self):
-        """Test that type is inferred from filename."""
-        content = "Some generic content here."
-        note_path = Path("/vault/notes/observation-daily.md")
-        
-        result = infer_type_from_content(content, note_path)
-        assert result == "observation"
-    
-    def test_infer_type_fallback(self):
-        """Test that fallback type is returned for generic content."""
-        content = "Just some random thoughts and notes."
-        note_path = Path("/vault/notes/random.md")
-        
-        result = infer_type_from_content(content, note_path)
-        assert result == "note"
+    @pytest.mark.parametrize("content,note_path,expected", [
+        ("I observed that the user behavior changed significantly today.", _NOTE, "observation"),
+        ("Hypothesis: The new feature will increase user engagement by 20%.", _NOTE, "hypothesis"),
+        ("Weekly review of progress and achievements this week.", _NOTE, "review"),
+        ("Some generic content here.", _OBSERVATIONS_FOLDER_NOTE, "observation"),
+        ("Some generic content here.", _OBSERVATION_FILENAME_NOTE, "observation"),
+        ("Just some random thoughts and notes.", _RANDOM_NOTE, "note"),
+    ], ids=["observation-content", "hypothesis-content", "review-content", "folder-path", "filename", "fallback"])
+    def test_infer_type(self, content, note_path, expected):
+        """Test that the type is inferred from content, folder or filename, falling back to note."""
+        assert infer_type_from_content(content, note_path) == expected
     
     def test_normalize_tags_from_content(self):
         """Test that hashtags in content are extracted to frontmatter."""
@@ -100,8 +71,10 @@ class TestTidier:
         assert result is False
         assert post.metadata['tags'] == ['existing']
     
-    def test_ensure_frontmatter_adds_missing_fields(self):
+    @patch('agent.frontmatter_handler.config')
+    def test_ensure_frontmatter_adds_missing_fields(self, mock_config):
         """Test that missing frontmatter fields are added."""
+        mock_config.is_para_vault = False
         post = frontmatter.Post("Some content")
         post.metadata = {}
         note_path = Path("/vault/observations/test.md")
@@ -114,8 +87,10 @@ class TestTidier:
         assert 'tags' in post.metadata
         assert post.metadata['status'] == 'active'
     
-    def test_ensure_frontmatter_preserves_existing(self):
+    @patch('agent.frontmatter_handler.config')
+    def test_ensure_frontmatter_preserves_existing(self, mock_config):
         """Test that existing frontmatter is preserved."""
+        mock_config.is_para_vault = False
         post = frontmatter.Post("Some content")
         post.metadata = {
             'type': 'custom',
@@ -130,3 +105,84 @@ class TestTidier:
         assert post.metadata['type'] == 'custom'
         assert post.metadata['status'] == 'completed'
         assert post.metadata['tags'] == ['existing']
+    
+    def test_frontmatter_loads_splits_header_and_body(self):
+        """Test that only the YAML header is parsed and the body is kept verbatim."""
+        text = "---\ntitle: Test\ntags:\n- one\n---\n\n# Heading\n---\nMore text\n"
+        
+        post = frontmatter.loads(text)
+        
+        assert post.metadata == {'title': 'Test', 'tags': ['one']}
+        assert post.content == "\n# Heading\n---\nMore text\n"
+        assert frontmatter.dumps(post) == text
+    
+    def test_frontmatter_round_trips_body_right_after_header(self):
+        """Test that a body directly below the header does not gain a blank line."""
+        text = "---\na: 1\n---\nbody\n"
+        
+        assert frontmatter.dumps(frontmatter.loads(text)) == text
+    
+    def test_frontmatter_keeps_empty_header(self):
+        """Test that an empty --- header survives a round trip."""
+        text = "---\n---\nbody"
+        
+        post = frontmatter.loads(text)
+        
+        assert post.metadata == {}
+        assert frontmatter.dumps(post) == text
+    
+    def test_frontmatter_loads_without_header(self):
+        """Test that notes without frontmatter get empty metadata and a header on save."""
+        post = frontmatter.loads("Plain note")
+        
+        assert post.metadata == {}
+        assert post.content == "Plain note"
+        
+        post.metadata['type'] = 'note'
+        assert frontmatter.dumps(post) == "---\ntype: note\n---\n\nPlain note"
+    
+    @patch('agent.frontmatter_handler.config')
+    @patch('agent.file_organizer.config')
+    @patch('agent.naming_utils.config')
+    @patch('agent.tidier.config')
+    def test_tidy_vault_does_not_overwrite_on_name_clash(self, mock_config, mock_naming_config, mock_organizer_config, mock_handler_config, tmp_path):
+        """Test that a note whose destination is already taken is left in place and counted as an error."""
+        for mock in (mock_config, mock_naming_config, mock_organizer_config, mock_handler_config):
+            mock.vault_path = tmp_path
+            mock.is_para_vault = False
+        mock_organizer_config.type_targets = {'note': tmp_path / "1-Inbox"}
+        (tmp_path / "a").mkdir()
+        (tmp_path / "b").mkdir()
+        (tmp_path / "a" / "x.md").write_text("one")
+        (tmp_path / "b" / "x.md").write_text("two")
+        
+        stats = tidy_vault()
+        
+        inbox_notes = list((tmp_path / "1-Inbox").iterdir())
+        assert len(inbox_notes) == 1
+        assert stats['files_moved'] == 1
+        assert stats['errors'] == 1
+        assert len(list(tmp_path.rglob("*.md"))) == 2
+    
+    @patch('agent.frontmatter_handler.config')
+    @patch('agent.file_organizer.config')
+    @patch('agent.naming_utils.config')
+    @patch('agent.tidier.config')
+    def test_tidy_vault_skips_notes_unchanged_since_last_run(self, mock_config, mock_naming_config, mock_organizer_config, mock_handler_config, tmp_path):
+        """Test that a second tidy only processes notes that changed after the first one."""
+        for mock in (mock_config, mock_naming_config, mock_organizer_config, mock_handler_config):
+            mock.vault_path = tmp_path
+            mock.is_para_vault = False
+        mock_organizer_config.type_targets = {'note': tmp_path / "1-Inbox"}
+        (tmp_path / "first.md").write_text("one")
+        (tmp_path / "second.md").write_text("two")
+        
+        first = tidy_vault()
+        (tmp_path / "third.md").write_text("three")
+        second = tidy_vault()
+        
+        assert first['files_processed'] == 2
+        assert second['files_processed'] == 3
+        assert second['files_unchanged'] == 2
+        assert (tmp_path / ".obsidian-agent" / "tidier-cache.json").is_file()
+        assert not list(tmp_path.glob("*.json"))
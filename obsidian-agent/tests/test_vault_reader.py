@@ -3,120 +3,152 @@
 
 import pytest
 from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import patch, MagicMock
 from datetime import datetime, timedelta
 
-from agent.vault_reader import get_observation_notes, read_note_content
+from agent.vault_reader import get_observation_notes, iter_markdown_files, map_files, read_note_content, read_text
+
+
+@pytest.fixture
+def mock_walk():
+    """Point the config at an existing observations folder and return the mocked walk."""
+    with patch('agent.vault_reader.config') as mock_config, \
+            patch('agent.vault_reader.iter_markdown_files') as walk:
+        # Mock the vault path and the observations path below it
+        mock_obs_path = MagicMock()
+        mock_config.vault_path.__truediv__.return_value = mock_obs_path
+        mock_obs_path.exists.return_value = True
+        yield walk
 
 
 class TestVaultReader:
     """Test cases for vault reader functionality."""
     
-    @patch('agent.vault_reader.config')
-    def test_get_observation_notes_returns_list(self, mock_config):
+    def test_get_observation_notes_returns_list(self, mock_walk):
         """Test that get_observation_notes returns a list."""
-        # Mock the vault path
-        mock_vault_path = MagicMock()
-        mock_config.vault_path = mock_vault_path
-        
-        # Mock the observations path
-        mock_obs_path = MagicMock()
-        mock_vault_path.__truediv__.return_value = mock_obs_path
-        mock_obs_path.exists.return_value = True
-        
-        # Mock rglob to return empty list
-        mock_obs_path.rglob.return_value = []
+        # Mock the walk to find no files
+        mock_walk.return_value = []
         
         result = get_observation_notes(days=7)
         assert isinstance(result, list)
     
-    @patch('agent.vault_reader.config')
-    def test_get_observation_notes_filters_by_date(self, mock_config):
+    def test_get_observation_notes_filters_by_date(self, mock_walk):
         """Test that get_observation_notes filters files by modification date."""
-        # Mock the vault path structure
-        mock_vault_path = MagicMock()
-        mock_config.vault_path = mock_vault_path
-        
-        mock_obs_path = MagicMock()
-        mock_vault_path.__truediv__.return_value = mock_obs_path
-        mock_obs_path.exists.return_value = True
-        
-        # Create mock files with different modification times
+        # Create mock directory entries with different modification times
         now = datetime.now()
         
         # Old file (10 days ago) - should be excluded
-        old_file = MagicMock()
-        old_file.is_file.return_value = True
-        old_file.name = "old_note.md"
-        old_file.suffix = ".md"
-        old_stat = MagicMock()
-        old_stat.st_mtime = (now - timedelta(days=10)).timestamp()
-        old_file.stat.return_value = old_stat
-        
-        # Recent file (2 days ago) - should be included
-        recent_file = MagicMock()
-        recent_file.is_file.return_value = True
-        recent_file.name = "recent_note.md"
-        recent_file.suffix = ".md"
-        recent_stat = MagicMock()
-        recent_stat.st_mtime = (now - timedelta(days=2)).timestamp()
-        recent_file.stat.return_value = recent_stat
-        
-        # Mock rglob to return both files
-        mock_obs_path.rglob.return_value = [old_file, recent_file]
+        old_file = _mock_entry("/vault/observations/old_note.md", now - timedelta(days=10))
+        
+        # Recent files (2 and 1 days ago) - should be included, newest first
+        recent_file = _mock_entry("/vault/observations/recent_note.md", now - timedelta(days=2))
+        newest_file = _mock_entry("/vault/observations/newest_note.md", now - timedelta(days=1))
+        
+        # Mock the walk to return all files
+        mock_walk.return_value = [old_file, recent_file, newest_file]
         
         result = get_observation_notes(days=7)
         
-        # Should only return the recent file
-        assert len(result) == 1
-        assert result[0] == recent_file
+        # Should only return the recent files, sorted by modification time
+        assert result == [Path(newest_file.path), Path(recent_file.path)]
     
-    @patch('agent.vault_reader.config')
-    def test_get_observation_notes_excludes_old_files(self, mock_config):
+    def test_get_observation_notes_excludes_old_files(self, mock_walk):
         """Test that get_observation_notes excludes files outside the timeframe even if they are markdown."""
-        # Mock the vault path structure
-        mock_vault_path = MagicMock()
-        mock_config.vault_path = mock_vault_path
-        
-        mock_obs_path = MagicMock()
-        mock_vault_path.__truediv__.return_value = mock_obs_path
-        mock_obs_path.exists.return_value = True
-        
-        # Create mock files - all old (should be excluded)
+        # Create mock directory entries - all old (should be excluded)
         now = datetime.now()
         
-        old_file_1 = MagicMock()
-        old_file_1.is_file.return_value = True
-        old_file_1.name = "old_note_1.md"
-        old_file_1.suffix = ".md"
-        old_stat_1 = MagicMock()
-        old_stat_1.st_mtime = (now - timedelta(days=15)).timestamp()
-        old_file_1.stat.return_value = old_stat_1
-        
-        old_file_2 = MagicMock()
-        old_file_2.is_file.return_value = True
-        old_file_2.name = "old_note_2.md"
-        old_file_2.suffix = ".md"
-        old_stat_2 = MagicMock()
-        old_stat_2.st_mtime = (now - timedelta(days=30)).timestamp()
-        old_file_2.stat.return_value = old_stat_2
-        
-        # Mock rglob to return old files
-        mock_obs_path.rglob.return_value = [old_file_1, old_file_2]
+        old_file_1 = _mock_entry("/vault/observations/old_note_1.md", now - timedelta(days=15))
+        old_file_2 = _mock_entry("/vault/observations/old_note_2.md", now - timedelta(days=30))
+        
+        # Mock the walk to return old files
+        mock_walk.return_value = [old_file_1, old_file_2]
         
         result = get_observation_notes(days=7)
         
         # Should return empty list since all files are outside the timeframe
         assert len(result) == 0
     
-    def test_read_note_content_basic(self):
+    def test_read_note_content_basic(self, tmp_path):
         """Test reading note content from a file."""
-        # This is a simple smoke test
-        # In a real scenario, you'd create a temporary file for testing
         content = "# Test Note\n\nThis is a test."
+        note = tmp_path / "test.md"
+        note.write_text(content, encoding='utf-8')
         
-        with patch('builtins.open', create=True) as mock_open:
-            mock_open.return_value.__enter__.return_value.read.return_value = content
-            
-            result = read_note_content(Path("test.md"))
-            assert result == content
+        result = read_note_content(note)
+        assert result == content
+    
+    def test_read_note_content_falls_back_to_latin1(self, tmp_path):
+        """Test that notes which are not valid UTF-8 are decoded as latin-1."""
+        note = tmp_path / "legacy.md"
+        note.write_bytes("Caf\u00e9 notes".encode('latin-1'))
+        
+        assert read_note_content(note) == "Caf\u00e9 notes"
+    
+    def test_iter_markdown_files_walks_subfolders(self, tmp_path):
+        """Test that the scandir walk finds markdown files at every depth."""
+        (tmp_path / "nested" / "deeper").mkdir(parents=True)
+        (tmp_path / "top.md").write_text("top")
+        (tmp_path / "nested" / "middle.md").write_text("middle")
+        (tmp_path / "nested" / "deeper" / "bottom.md").write_text("bottom")
+        (tmp_path / "nested" / "image.png").write_text("not a note")
+        (tmp_path / "folder.md").mkdir()
+        
+        names = sorted(entry.name for entry in iter_markdown_files(tmp_path))
+        
+        assert names == ["bottom.md", "middle.md", "top.md"]
+    
+    def test_map_files_keeps_order_serial_and_parallel(self, tmp_path):
+        """Test that map_files returns results in input order, with the content read ahead when serial."""
+        paths = []
+        for i in range(10):
+            path = tmp_path / f"note-{i}.md"
+            path.write_text(f"note {i}")
+            paths.append(path)
+        
+        assert list(map_files(_path_and_content, paths)) == [(str(path), f"note {i}") for i, path in enumerate(paths)]
+        assert list(map_files(_path_and_content, paths, jobs=2)) == [(str(path), None) for path in paths]
+    
+    def test_map_files_uses_every_cpu_for_zero_jobs(self, tmp_path):
+        """Test that jobs=0 sizes the process pool to the CPU count."""
+        paths = [tmp_path / f"note-{i}.md" for i in range(10)]
+        
+        with patch('agent.vault_reader.os.cpu_count', return_value=3), \
+                patch('agent.vault_reader.ProcessPoolExecutor') as mock_pool:
+            mock_pool.return_value.__enter__.return_value.map.return_value = iter([])
+            list(map_files(_path_and_content, paths, jobs=0))
+        
+        mock_pool.assert_called_once_with(max_workers=3)
+    
+    def test_map_files_runs_serially_for_negative_jobs(self, tmp_path):
+        """Test that a negative job count does not start a process pool."""
+        paths = [tmp_path / f"note-{i}.md" for i in range(10)]
+        
+        with patch('agent.vault_reader.ProcessPoolExecutor') as mock_pool:
+            list(map_files(_path_and_content, paths, jobs=-3))
+        
+        mock_pool.assert_not_called()
+    
+    def test_map_files_passes_none_for_unreadable_files(self, tmp_path):
+        """Test that a file the read-ahead cannot read is handed over with no content."""
+        missing = tmp_path / "missing.md"
+        
+        assert list(map_files(_path_and_content, [missing])) == [(str(missing), None)]
+    
+    def test_read_text_translates_newlines(self, tmp_path):
+        """Test that read_text returns the whole file with newlines normalized like open()."""
+        note = tmp_path / "note.md"
+        note.write_bytes("---\r\ntitle: Café\r\n---\r\nBody\n".encode('utf-8'))
+        
+        assert read_text(note) == "---\ntitle: Café\n---\nBody\n"
+
+
+def _path_and_content(path, content):
+    """Module-level map_files callback so it can be sent to worker processes."""
+    return str(path), content
+
+
+def _mock_entry(path, mtime):
+    """Build a fake os.DirEntry for a markdown file modified at mtime."""
+    stat_result = SimpleNamespace(st_mtime=mtime.timestamp())
+    return SimpleNamespace(path=path, name=Path(path).name, stat=lambda: stat_result)